@@ -5,6 +5,7 @@ Main RillClient implementation
 import os
 import json
 import time
+import threading
 from typing import Optional, Dict, Any, Tuple
 from urllib.parse import urljoin
 import httpx
@@ -97,9 +98,15 @@ class RillClient:
         >>> # With caching enabled
         >>> client = RillClient(org="my-org", project="my-project", enable_cache=True)
         >>> client.clear_cache()  # Clear all cached data
+
+        >>> # Close the pooled HTTP connections when done
+        >>> with RillClient(org="my-org", project="my-project") as client:
+        ...     results = client.queries.metrics(query)
     """
 
     DEFAULT_API_BASE = "https://api.rilldata.com/v1/"
+    HTTP_TIMEOUT = 30.0
+    HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
 
     def __init__(
         self,
@@ -123,6 +130,8 @@ class RillClient:
 
         self.api_base_url = api_base_url.rstrip("/") + "/"
         self._cache = SimpleCache(ttl=cache_ttl) if enable_cache else None
+        self._http_client: Optional[httpx.Client] = None
+        self._http_client_lock = threading.Lock()
 
         # Load configuration with environment variable fallback
         self.config = RillConfig.from_env(
@@ -205,6 +214,33 @@ class RillClient:
                 f"Please set environment variable(s) or pass org/project parameters to RillClient()."
             )
 
+    def _get_http_client(self) -> httpx.Client:
+        """
+        Return the HTTP client shared by all requests from this RillClient.
+
+        The client is created on first use so every request reuses the same
+        connection pool (keep-alive TCP/TLS connections) instead of opening a
+        new one per request. Creation is locked so threads sharing this
+        RillClient also share one pool.
+        """
+        if self._http_client is None:
+            with self._http_client_lock:
+                if self._http_client is None:
+                    self._http_client = httpx.Client(timeout=self.HTTP_TIMEOUT, limits=self.HTTP_LIMITS)
+        return self._http_client
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool. Safe to call more than once."""
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+
+    def __enter__(self) -> "RillClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _make_api_request(
         self,
         method: str,
@@ -242,84 +278,84 @@ class RillClient:
         start_time = time.time()
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.request(
+            client = self._get_http_client()
+            response = client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                params=params,
+                json=json_data,
+            )
+            duration = time.time() - start_time
+
+            # Check for error status codes
+            if response.status_code >= 400:
+                # Try to extract error message from JSON response
+                error_message = None
+                try:
+                    error_data = response.json()
+                    error_message = error_data.get('error') or error_data.get('message')
+                except:
+                    pass
+
+                # Build error message
+                if error_message:
+                    msg = f"Request failed: {method} {endpoint} - {response.status_code} {response.reason_phrase}: {error_message}"
+                else:
+                    msg = f"Request failed: {method} {endpoint} - {response.status_code} {response.reason_phrase}"
+
+                self.logger.error(
+                    f"Request failed: {method} {endpoint}",
+                    impl="api",
                     method=method,
-                    url=url,
-                    headers=headers,
-                    params=params,
-                    json=json_data,
+                    endpoint=endpoint,
+                    status_code=response.status_code,
+                    error_message=error_message,
+                    duration=duration
                 )
-                duration = time.time() - start_time
-
-                # Check for error status codes
-                if response.status_code >= 400:
-                    # Try to extract error message from JSON response
-                    error_message = None
-                    try:
-                        error_data = response.json()
-                        error_message = error_data.get('error') or error_data.get('message')
-                    except:
-                        pass
-
-                    # Build error message
-                    if error_message:
-                        msg = f"Request failed: {method} {endpoint} - {response.status_code} {response.reason_phrase}: {error_message}"
-                    else:
-                        msg = f"Request failed: {method} {endpoint} - {response.status_code} {response.reason_phrase}"
-
-                    self.logger.error(
-                        f"Request failed: {method} {endpoint}",
-                        impl="api",
-                        method=method,
-                        endpoint=endpoint,
-                        status_code=response.status_code,
-                        error_message=error_message,
-                        duration=duration
-                    )
 
-                    raise RillAPIError(
-                        msg,
-                        status_code=response.status_code,
-                        response_body=response.text
-                    )
+                raise RillAPIError(
+                    msg,
+                    status_code=response.status_code,
+                    response_body=response.text
+                )
 
-                # Parse JSON response
-                try:
-                    data = response.json()
+            # Parse JSON response
+            try:
+                data = response.json()
+                self.logger.debug(
+                    f"Request completed: {method} {endpoint}",
+                    impl="api",
+                    method=method,
+                    endpoint=endpoint,
+                    status_code=response.status_code,
+                    duration=duration
+                )
+                return data
+            except json.JSONDecodeError:
+                # Some endpoints might return empty responses
+                if response.status_code == 204 or not response.text:
                     self.logger.debug(
-                        f"Request completed: {method} {endpoint}",
-                        impl="api",
-                        method=method,
-                        endpoint=endpoint,
-                        status_code=response.status_code,
-                        duration=duration
-                    )
-                    return data
-                except json.JSONDecodeError:
-                    # Some endpoints might return empty responses
-                    if response.status_code == 204 or not response.text:
-                        self.logger.debug(
-                            f"Request returned empty response: {method} {endpoint}",
-                            impl="api",
-                            status_code=response.status_code,
-                            duration=duration
-                        )
-                        return None
-                    self.logger.error(
-                        f"Failed to parse response as JSON",
+                        f"Request returned empty response: {method} {endpoint}",
                         impl="api",
-                        method=method,
-                        endpoint=endpoint,
                         status_code=response.status_code,
-                        response_text=response.text[:200],  # Truncate
                         duration=duration
                     )
-                    raise RillAPIError(
-                        f"Failed to parse response as JSON: {response.text}",
-                        status_code=response.status_code,
-                        response_body=response.text
-                    )
+                    return None
+                self.logger.error(
+                    f"Failed to parse response as JSON",
+                    impl="api",
+                    method=method,
+                    endpoint=endpoint,
+                    status_code=response.status_code,
+                    response_text=response.text[:200],  # Truncate
+                    duration=duration
+                )
+                raise RillAPIError(
+                    f"Failed to parse response as JSON: {response.text}",
+                    status_code=response.status_code,
+                    response_body=response.text
+                )
 
         except httpx.HTTPError as e:
             duration = time.time() - start_time
@@ -1,6 +1,8 @@
 """IFrame models for embedding Rill dashboards."""
 
-from typing import Any, Dict, Literal, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Literal, Optional
+from urllib.parse import ParseResult, parse_qs, urlparse
 
 from pydantic import BaseModel, Field
 
@@ -58,6 +60,10 @@ class IFrameResponse(BaseModel):
     - access_token: str - JWT access token (embedded in iframe_src)
     - ttl_seconds: int - Time to live for the access token
 
+    Properties:
+    - parsed_url: ParseResult - iframe_src split into URL components (parsed once)
+    - query_params: Dict[str, List[str]] - iframe_src query parameters (parsed once)
+
     Example URL format:
     https://ui.rilldata.com/-/embed?access_token=<token>&instance_id=<id>&kind=MetricsView&resource=<name>&runtime_host=<host>&theme_mode=dark
     """
@@ -69,3 +75,13 @@ class IFrameResponse(BaseModel):
     ttl_seconds: int = Field(alias="ttlSeconds")
 
     model_config = {"populate_by_name": True}
+
+    @cached_property
+    def parsed_url(self) -> ParseResult:
+        """iframe_src split into URL components, parsed on first access"""
+        return urlparse(self.iframe_src)
+
+    @cached_property
+    def query_params(self) -> Dict[str, List[str]]:
+        """iframe_src query parameters (as returned by parse_qs), parsed on first access"""
+        return parse_qs(self.parsed_url.query)
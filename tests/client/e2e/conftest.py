@@ -4,19 +4,278 @@ Pytest fixtures for E2E tests that save results to disk for review
 Note: Debug folder clearing is handled by the root conftest.py clear_debug_folder fixture
 """
 
+import os
 import json
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
 from pathlib import Path
+from typing import List
 import pytest
 
+from pyrill import RillClient
+from pyrill.exceptions import RillAPIError
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 
 # E2E Test Configuration Constants
 TEST_ORG = "demo"
 TEST_PROJECT = "rill-openrtb-prog-ads"
 TEST_METRICS_VIEW = "bids_metrics"
 TEST_PARTITION_PROJECT = "my-rill-tutorial"
+TEST_PARTITIONED_MODEL = "SQL_increment_tutorial"
 TEST_EXPECTED_METRICS_VIEW_ANNOTATIONS = "auction_metrics"
 
 
+log = logging.getLogger(__name__)
+
+
+def _coerce(value):
+    """Convert a result cell to a JSON-native value: dates/times as ISO 8601, Decimals as strings"""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def coerce_row(row: dict) -> dict:
+    """Return a copy of a result row whose values the JSON encoder handles without a default= hook"""
+    return {key: _coerce(value) for key, value in row.items()}
+
+
+def _json_default(obj):
+    """Serialize pydantic models and dataclasses natively; other unknown types are coerced, or logged and stringified"""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if is_dataclass(obj) and not isinstance(obj, type):
+        # Shallow: the encoder recurses into the field values itself
+        # (orjson serializes dataclasses without reaching this hook)
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    coerced = _coerce(obj)
+    if coerced is not obj:
+        return coerced
+    log.debug("Falling back to str() for JSON value of type %s", type(obj).__name__)
+    return str(obj)
+
+
+def dump_json(data, indent: bool = True, newline: bool = False) -> bytes:
+    """
+    Serialize E2E debug/result data to JSON bytes.
+
+    Uses orjson when it is installed and the stdlib json module otherwise.
+    Pydantic models can be passed as-is; they are dumped by the encoder.
+    Pass indent=False for compact single-line output (e.g. NDJSON records)
+    and newline=True to terminate the output with a newline.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(data, default=_json_default, option=option)
+    if indent:
+        encoded = json.dumps(data, indent=2, default=_json_default).encode()
+    else:
+        encoded = json.dumps(data, separators=(",", ":"), default=_json_default).encode()
+    return encoded + b"\n" if newline else encoded
+
+
+# Written JSON files are compact unless PYRILL_E2E_PRETTY is set for human review
+PRETTY_JSON = bool(os.environ.get("PYRILL_E2E_PRETTY"))
+
+# Debug output is opt-in (--e2e-debug or PYRILL_E2E_DEBUG): serializing and
+# writing it is wasted work on CI
+DEBUG_ENABLED = bool(os.environ.get("PYRILL_E2E_DEBUG"))
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> Path:
+    """
+    Write data to path through a per-process temp file renamed over path
+
+    Concurrent runs (e.g. xdist workers or two pytest invocations sharing an
+    output directory) never leave a partially written file behind.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return path
+
+
+def write_json(path: Path, data) -> Path:
+    """Write data to path as newline-terminated JSON with a single atomic write"""
+    return write_bytes_atomic(path, dump_json(data, indent=PRETTY_JSON, newline=True))
+
+
+class WriteQueue:
+    """Result/error file writes queued on a background pool"""
+
+    def __init__(self, pool: ThreadPoolExecutor):
+        self._pool = pool
+        self._pending: List[Future] = []
+
+    def submit(self, fn, *args) -> None:
+        """Run fn(*args) on the pool"""
+        self._pending.append(self._pool.submit(fn, *args))
+
+    def join(self) -> None:
+        """Wait for every queued write, re-raising the first encode/write error"""
+        try:
+            for future in self._pending:
+                future.result()
+        finally:
+            self._pending.clear()
+
+
+@pytest.fixture(scope="module")
+def write_queue():
+    """
+    Queue output file writes so JSON encoding overlaps the next test's API round-trip.
+
+    Each module gets its own pool, joined and shut down after the module's
+    tests have run.
+    """
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="e2e-write") as pool:
+        queue = WriteQueue(pool)
+        yield queue
+        queue.join()
+
+
+@pytest.fixture(scope="module")
+def ensure_debug_dir(request, clear_debug_folder):
+    """
+    Create the requesting module's DEBUG_DIR once, after the debug folder is reset.
+
+    Modules opt in with ``pytestmark = pytest.mark.usefixtures("ensure_debug_dir")``;
+    nothing is created unless debug output is enabled.
+    """
+    debug_dir = request.module.DEBUG_DIR
+    if DEBUG_ENABLED:
+        debug_dir.mkdir(parents=True, exist_ok=True)
+    return debug_dir
+
+
+@pytest.fixture(scope="session")
+def rill_token():
+    """
+    Return RILL_USER_TOKEN, skipping the requesting tests when it is not set.
+
+    Checked once per session. This is not autouse because some e2e modules
+    also contain model-only tests that must run without credentials.
+    """
+    token = os.environ.get("RILL_USER_TOKEN")
+    if not token:
+        pytest.skip("RILL_USER_TOKEN not set")
+    return token
+
+
+@pytest.fixture(scope="session")
+def client(rill_token):
+    """
+    Create a real client instance shared by every E2E test in the session.
+
+    Test classes that need a different org/project can still shadow this
+    fixture with their own `client` fixture. Its connection pool is closed
+    at the end of the session.
+    """
+    client = RillClient(api_token=rill_token, org=TEST_ORG, project=TEST_PROJECT)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def real_client(client):
+    """
+    Real RillClient for TEST_ORG/TEST_PROJECT, used by the query e2e modules
+
+    An alias of the session `client`, so its pooled keep-alive connections
+    are reused by every query in the session, including concurrent prefetches.
+    """
+    return client
+
+
+@pytest.fixture(scope="session")
+def demo_client(rill_token):
+    """
+    Create a real client for the partitions test project, shared by the session.
+
+    The partitions tests need a project with partitioned models, so they use
+    TEST_PARTITION_PROJECT instead of the default TEST_PROJECT.
+    """
+    client = RillClient(api_token=rill_token, org=TEST_ORG, project=TEST_PARTITION_PROJECT)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def partitioned_model():
+    """Known partitioned model in TEST_PARTITION_PROJECT"""
+    return TEST_PARTITIONED_MODEL
+
+
+@pytest.fixture(scope="session")
+def sample_partitions(demo_client, partitioned_model):
+    """List the partitioned model's partitions once per session"""
+    try:
+        return demo_client.partitions.list(partitioned_model)
+    except RillAPIError as e:
+        if "404" in str(e) or "not found" in str(e).lower():
+            pytest.skip(f"Model {partitioned_model} not available")
+        raise
+
+
+@pytest.fixture(scope="session")
+def project_list(client):
+    """List the projects visible to the test user once per session"""
+    return client.projects.list()
+
+
+@pytest.fixture(scope="session")
+def first_project_name(project_list):
+    """Name of the first available project (skips when there are none)"""
+    if not project_list:
+        pytest.skip("No projects available")
+    return project_list[0].name
+
+
+@pytest.fixture(scope="session")
+def reports_list(client):
+    """List the reports in TEST_ORG/TEST_PROJECT once per session"""
+    return client.reports.list(project=TEST_PROJECT, org=TEST_ORG)
+
+
+@pytest.fixture(scope="class")
+def annotations_api_call(client):
+    """Return a builder for the debug 'api_call' block of an annotations query"""
+    org_name = client.config.default_org
+    project_name = client.config.default_project
+    base_url = "https://api.rilldata.com/v1/"
+
+    def _api_call(metrics_view: str) -> dict:
+        endpoint = f"organizations/{org_name}/projects/{project_name}/runtime/queries/metrics-views/{metrics_view}/annotations"
+        return {
+            "method": "POST",
+            "endpoint": endpoint,
+            "base_url": base_url,
+            "full_url": f"{base_url}{endpoint}",
+            "org": org_name,
+            "project": project_name
+        }
+
+    return _api_call
+
+
+@pytest.fixture(scope="session")
+def test_org_and_project():
+    """Return configured test organization and project"""
+    return TEST_ORG, TEST_PROJECT
+
+
 # Storage for test results during the session
 _reports_test_results = []
 
@@ -3,14 +3,13 @@ End-to-end tests for Annotations resource
 
 These tests require real credentials and make actual API calls.
 Run with: pytest tests/client/e2e/test_annotations.py --run-e2e -v
+Add --e2e-debug (or set PYRILL_E2E_DEBUG=1) to save debug output.
 """
 
-import os
-import json
+import logging
 import pytest
 from pathlib import Path
 
-from pyrill import RillClient
 from pyrill.models.annotations import (
     Annotation,
     AnnotationsQuery,
@@ -18,117 +17,107 @@ from pyrill.models.annotations import (
 )
 from pyrill.models.query import TimeRange, TimeGrain
 from pyrill.exceptions import RillError
-from tests.client.e2e.conftest import TEST_ORG, TEST_PROJECT
+from tests.client.e2e.conftest import DEBUG_ENABLED, dump_json
+
+log = logging.getLogger(__name__)
 
 # Debug output directory
 DEBUG_DIR = Path(__file__).parent.parent.parent / "debug" / "annotations"
 
+# Create DEBUG_DIR once per module (shared fixture in conftest)
+pytestmark = pytest.mark.usefixtures("ensure_debug_dir")
+
+# Queries are validated once at import and shared by every test
+_BASIC_QUERY = AnnotationsQuery(measures=["requests"], limit=100)
+_DAY_QUERY = AnnotationsQuery(measures=["requests"], time_grain=TimeGrain.DAY, limit=50)
+_NONEXISTENT_VIEW_QUERY = AnnotationsQuery(measures=["some_measure"], limit=10)
+
 
 def save_debug_output(test_name: str, data: dict):
     """Save debug output for inspection"""
-    DEBUG_DIR.mkdir(parents=True, exist_ok=True)
+    if not DEBUG_ENABLED:
+        return
     filepath = DEBUG_DIR / f"{test_name}.json"
-    filepath.write_text(json.dumps(data, indent=2, default=str))
-    print(f"\n📝 Debug output saved to: {filepath}")
+    filepath.write_bytes(dump_json(data))
+    log.debug("Debug output saved to: %s", filepath)
 
 
-@pytest.mark.e2e
-class TestE2EAnnotations:
-    """E2E tests for annotations query operations"""
+def save_debug_ndjson(test_name: str, meta: dict, rows: list):
+    """
+    Stream debug output as NDJSON: one metadata line, then one line per row.
+
+    Rows are encoded one at a time so the whole payload is never held as a
+    single JSON string.
+    """
+    if not DEBUG_ENABLED:
+        return
+    filepath = DEBUG_DIR / f"{test_name}.ndjson"
+    with open(filepath, "wb") as f:
+        f.write(dump_json(meta, indent=False) + b"\n")
+        for row in rows:
+            f.write(dump_json(row, indent=False) + b"\n")
+    log.debug("Debug output saved to: %s", filepath)
 
-    @pytest.fixture(scope="class")
-    def client(self):
-        """Create a real client instance"""
-        if not os.environ.get("RILL_USER_TOKEN"):
-            pytest.skip("RILL_USER_TOKEN not set")
 
-        return RillClient(org=TEST_ORG, project=TEST_PROJECT)
+@pytest.fixture(scope="session")
+def base_annotations_query():
+    """Basic annotations query without time_range (returns all annotations)"""
+    return _BASIC_QUERY
 
-    @pytest.fixture(scope="class")
-    def debug_dir(self):
-        """Create debug directory for saving API responses"""
-        # Ensure debug directory exists
-        DEBUG_DIR.mkdir(parents=True, exist_ok=True)
-        print(f"Debug directory created at: {DEBUG_DIR.absolute()}")
-        return DEBUG_DIR
 
-    def test_query_annotations_basic(self, client, debug_dir):
+@pytest.fixture(scope="session")
+def base_annotations_response(client, base_annotations_query):
+    """Query auction_metrics annotations with the basic query once per session"""
+    return client.annotations.query("auction_metrics", base_annotations_query)
+
+
+@pytest.mark.e2e
+class TestE2EAnnotations:
+    """E2E tests for annotations query operations"""
+
+    def test_query_annotations_basic(self, annotations_api_call, base_annotations_query, base_annotations_response):
         """Test querying annotations for a metrics view"""
-        print("\n" + "="*80)
-        print("TEST: Query Annotations (Basic)")
-        print("="*80)
+        log.info("TEST: Query Annotations (Basic)")
 
-        # Create a basic query without time_range (will return all annotations)
-        query = AnnotationsQuery(
-            measures=["requests"],
-            limit=100
-        )
+        query = base_annotations_query
 
-        print(f"Querying annotations for metrics view: auction_metrics")
-        print(f"Measures: {query.measures}")
-        print(f"Time Range: None (all annotations)")
-        print(f"Limit: {query.limit}")
+        log.debug("Querying annotations for metrics view: auction_metrics")
+        log.debug("Measures: %s", query.measures)
+        log.debug("Time Range: None (all annotations)")
+        log.debug("Limit: %s", query.limit)
 
-        result = client.annotations.query("auction_metrics", query)
+        result = base_annotations_response
 
         assert isinstance(result, AnnotationsResponse), f"Expected AnnotationsResponse, got {type(result)}"
         assert hasattr(result, "rows"), "Response should have 'rows' attribute"
 
-        print(f"✅ Got {len(result.rows) if result.rows else 0} annotations")
+        log.debug("Got %d annotations", len(result.rows) if result.rows else 0)
 
-        # Save debug output
-        annotations_data = []
         if result.rows:
             assert isinstance(result.rows, list), f"Expected rows to be list, got {type(result.rows)}"
             assert all(isinstance(ann, Annotation) for ann in result.rows), "Not all rows are Annotation instances"
 
-            for ann in result.rows:
-                ann_dict = {
-                    "time": ann.time,
-                    "time_end": ann.time_end,
-                    "description": ann.description,
-                    "duration": ann.duration,
-                    "for_measures": ann.for_measures,
-                    "additional_fields": ann.additional_fields
-                }
-                annotations_data.append(ann_dict)
-                print(f"  • {ann.time}: {ann.description}")
-                if ann.for_measures:
-                    print(f"    For measures: {', '.join(ann.for_measures)}")
-
-        # Build API call info for debugging
-        org_name = client.config.default_org
-        project_name = client.config.default_project
-        endpoint = f"organizations/{org_name}/projects/{project_name}/runtime/queries/metrics-views/auction_metrics/annotations"
-
-        save_debug_output("test_query_annotations_basic", {
+            if log.isEnabledFor(logging.DEBUG):
+                for ann in result.rows:
+                    log.debug("  • %s: %s", ann.time, ann.description)
+                    if ann.for_measures:
+                        log.debug("    For measures: %s", ", ".join(ann.for_measures))
+
+        save_debug_ndjson("test_query_annotations_basic", {
             "test": "query_annotations_basic",
-            "api_call": {
-                "method": "POST",
-                "endpoint": endpoint,
-                "base_url": "https://api.rilldata.com/v1/",
-                "full_url": f"https://api.rilldata.com/v1/{endpoint}",
-                "org": org_name,
-                "project": project_name
-            },
+            "api_call": annotations_api_call("auction_metrics"),
             "request": {
                 "metrics_view": "auction_metrics",
-                "query_params": {
-                    "measures": query.measures,
-                    "time_range": query.time_range.expression if query.time_range else None,
-                    "time_grain": query.time_grain.value if query.time_grain else None,
-                    "limit": query.limit
-                }
+                "query_params": query.model_dump(mode="json", exclude_none=True)
             },
             "response": {
-                "count": len(result.rows) if result.rows else 0,
-                "annotations": annotations_data
+                "count": len(result.rows) if result.rows else 0
             }
-        })
+        }, result.rows or [])
 
         # Verify response structure (may have 0 or more annotations)
         assert result.rows is not None, "Expected rows to not be None"
-        print(f"Note: Found {len(result.rows)} annotations (may be 0 if none configured)")
+        log.debug("Found %d annotations (may be 0 if none configured)", len(result.rows))
 
         # Verify first annotation structure
         if result.rows:
@@ -136,120 +125,66 @@ class TestE2EAnnotations:
             assert hasattr(ann, "time"), "Annotation should have 'time' attribute"
             assert hasattr(ann, "description"), "Annotation should have 'description' attribute"
 
-    def test_query_annotations_with_time_grain(self, client, debug_dir):
+    def test_query_annotations_with_time_grain(self, client, annotations_api_call):
         """Test querying annotations with time grain"""
-        print("\n" + "="*80)
-        print("TEST: Query Annotations (With Time Grain)")
-        print("="*80)
+        log.info("TEST: Query Annotations (With Time Grain)")
 
-        query = AnnotationsQuery(
-            measures=["requests"],
-            time_grain=TimeGrain.DAY,
-            limit=50
-        )
+        query = _DAY_QUERY
 
-        print(f"Querying annotations with time grain: {query.time_grain}")
-        print(f"Time Range: None (all annotations)")
+        log.debug("Querying annotations with time grain: %s", query.time_grain)
+        log.debug("Time Range: None (all annotations)")
 
         result = client.annotations.query("auction_metrics", query)
 
         assert isinstance(result, AnnotationsResponse)
-        print(f"✅ Got {len(result.rows) if result.rows else 0} annotations")
+        log.debug("Got %d annotations", len(result.rows) if result.rows else 0)
 
-        # Save debug output
-        annotations_data = []
-        if result.rows:
+        if result.rows and log.isEnabledFor(logging.DEBUG):
             for ann in result.rows:
-                annotations_data.append({
-                    "time": ann.time,
-                    "description": ann.description,
-                    "duration": ann.duration,
-                })
-                print(f"  • {ann.time}: {ann.description}")
-
-        # Build API call info for debugging
-        org_name = client.config.default_org
-        project_name = client.config.default_project
-        endpoint = f"organizations/{org_name}/projects/{project_name}/runtime/queries/metrics-views/auction_metrics/annotations"
-
-        save_debug_output("test_query_annotations_with_time_grain", {
+                log.debug("  • %s: %s", ann.time, ann.description)
+
+        save_debug_ndjson("test_query_annotations_with_time_grain", {
             "test": "query_annotations_with_time_grain",
-            "api_call": {
-                "method": "POST",
-                "endpoint": endpoint,
-                "base_url": "https://api.rilldata.com/v1/",
-                "full_url": f"https://api.rilldata.com/v1/{endpoint}",
-                "org": org_name,
-                "project": project_name
-            },
+            "api_call": annotations_api_call("auction_metrics"),
             "request": {
                 "metrics_view": "auction_metrics",
-                "query_params": {
-                    "measures": query.measures,
-                    "time_range": query.time_range.expression if query.time_range else None,
-                    "time_grain": query.time_grain.value if query.time_grain else None,
-                    "limit": query.limit
-                }
+                "query_params": query.model_dump(mode="json", exclude_none=True)
             },
             "response": {
-                "count": len(result.rows) if result.rows else 0,
-                "annotations": annotations_data
+                "count": len(result.rows) if result.rows else 0
             }
-        })
+        }, result.rows or [])
 
-    def test_query_annotations_nonexistent_metrics_view(self, client, debug_dir):
+    def test_query_annotations_nonexistent_metrics_view(self, client, annotations_api_call):
         """Test querying annotations for non-existent metrics view raises error"""
-        print("\n" + "="*80)
-        print("TEST: Query Annotations (Nonexistent Metrics View)")
-        print("="*80)
+        log.info("TEST: Query Annotations (Nonexistent Metrics View)")
 
-        query = AnnotationsQuery(
-            measures=["some_measure"],
-            limit=10
-        )
+        query = _NONEXISTENT_VIEW_QUERY
 
         nonexistent_view = "nonexistent-metrics-view-12345"
-        print(f"Attempting to query nonexistent metrics view: {nonexistent_view}")
+        log.debug("Attempting to query nonexistent metrics view: %s", nonexistent_view)
 
         with pytest.raises(RillError) as exc_info:
             client.annotations.query(nonexistent_view, query)
 
         error_msg = str(exc_info.value)
-        print(f"✅ Got expected error: {error_msg}")
-
-        # Build API call info for debugging
-        org_name = client.config.default_org
-        project_name = client.config.default_project
-        endpoint = f"organizations/{org_name}/projects/{project_name}/runtime/queries/metrics-views/{nonexistent_view}/annotations"
+        log.debug("Got expected error: %s", error_msg)
 
         save_debug_output("test_query_annotations_nonexistent", {
             "test": "query_annotations_nonexistent",
-            "api_call": {
-                "method": "POST",
-                "endpoint": endpoint,
-                "base_url": "https://api.rilldata.com/v1/",
-                "full_url": f"https://api.rilldata.com/v1/{endpoint}",
-                "org": org_name,
-                "project": project_name
-            },
+            "api_call": annotations_api_call(nonexistent_view),
             "request": {
                 "metrics_view": nonexistent_view,
-                "query_params": {
-                    "measures": query.measures,
-                    "time_range": query.time_range.expression if query.time_range else None,
-                    "limit": query.limit
-                }
+                "query_params": query.model_dump(mode="json", exclude_none=True)
             },
             "response": {
                 "error": error_msg
             }
         })
 
-    def test_query_annotations_with_dict(self, client, debug_dir):
+    def test_query_annotations_with_dict(self, client, annotations_api_call):
         """Test that query method accepts dict input"""
-        print("\n" + "="*80)
-        print("TEST: Query Annotations (Dict Input)")
-        print("="*80)
+        log.info("TEST: Query Annotations (Dict Input)")
 
         # Test the convenience feature of accepting dicts
         query_dict = {
@@ -257,28 +192,16 @@ class TestE2EAnnotations:
             "limit": 10
         }
 
-        print(f"Querying with dict input: {query_dict}")
+        log.debug("Querying with dict input: %s", query_dict)
 
         result = client.annotations.query("auction_metrics", query_dict)
 
         assert isinstance(result, AnnotationsResponse)
-        print(f"✅ Query with dict succeeded, got {len(result.rows) if result.rows else 0} annotations")
-
-        # Build API call info for debugging
-        org_name = client.config.default_org
-        project_name = client.config.default_project
-        endpoint = f"organizations/{org_name}/projects/{project_name}/runtime/queries/metrics-views/auction_metrics/annotations"
+        log.debug("Query with dict succeeded, got %d annotations", len(result.rows) if result.rows else 0)
 
         save_debug_output("test_query_annotations_with_dict", {
             "test": "query_annotations_with_dict",
-            "api_call": {
-                "method": "POST",
-                "endpoint": endpoint,
-                "base_url": "https://api.rilldata.com/v1/",
-                "full_url": f"https://api.rilldata.com/v1/{endpoint}",
-                "org": org_name,
-                "project": project_name
-            },
+            "api_call": annotations_api_call("auction_metrics"),
             "request": {
                 "metrics_view": "auction_metrics",
                 "query_params": query_dict
@@ -2,32 +2,23 @@
 End-to-end tests for RillClient
 
 These tests require real credentials and make actual API/CLI calls.
-Run with: pytest tests/e2e/ --run-e2e
+Run with: pytest tests/client/e2e/test_client_e2e.py --run-e2e
+
+The tests only read independent endpoints and share no mutable state, so they
+can run in parallel with pytest-xdist: pytest --run-e2e -n auto
+(each xdist worker builds its own session-scoped client).
 """
 
-import os
 import pytest
 
-from pyrill import RillClient
 from pyrill.models import Org, Project, Token, ProjectResources, ProjectStatus
 from pyrill.exceptions import RillError
-from tests.client.e2e.conftest import TEST_ORG, TEST_PROJECT
 
 
 @pytest.mark.e2e
 class TestE2EClientBasics:
     """E2E tests for basic client operations"""
 
-    @pytest.fixture(scope="class")
-    def client(self):
-        """Create a real client instance"""
-        # Ensure RILL_USER_TOKEN is set
-        if not os.environ.get("RILL_USER_TOKEN"):
-            pytest.skip("RILL_USER_TOKEN not set")
-
-        # Use configured test org/project as defaults
-        return RillClient(org=TEST_ORG, project=TEST_PROJECT)
-
     def test_whoami(self, client):
         """Test whoami returns user information"""
         from pyrill.models import User
@@ -104,21 +95,6 @@ class TestE2EClientBasics:
 class TestE2ERuntimeResources:
     """E2E tests for runtime resources"""
 
-    @pytest.fixture(scope="class")
-    def client(self):
-        """Create a real client instance"""
-        if not os.environ.get("RILL_USER_TOKEN"):
-            pytest.skip("RILL_USER_TOKEN not set")
-
-        # Use configured test org/project as defaults
-        return RillClient(org=TEST_ORG, project=TEST_PROJECT)
-
-    @pytest.fixture(scope="class")
-    def test_org_and_project(self):
-        """Return configured test organization and project"""
-        # Use configured constants instead of dynamically picking from list
-        return TEST_ORG, TEST_PROJECT
-
     def test_get_project_resources(self, client, test_org_and_project):
         """Test getting runtime resources for a real project"""
         org_name, project_name = test_org_and_project
@@ -152,29 +128,16 @@ class TestE2ERuntimeResources:
 class TestE2EErrorHandling:
     """E2E tests for error handling with real API"""
 
-    @pytest.fixture(scope="class")
-    def client(self):
-        """Create a real client instance"""
-        if not os.environ.get("RILL_USER_TOKEN"):
-            pytest.skip("RILL_USER_TOKEN not set")
-
-        # Use configured test org/project as defaults
-        return RillClient(org=TEST_ORG, project=TEST_PROJECT)
-
-    def test_get_nonexistent_org(self, client):
-        """Test getting a non-existent org"""
-        with pytest.raises(RillError):
-            client.orgs.get("nonexistent-org-12345")
-
-    def test_get_nonexistent_project(self, client):
-        """Test getting a non-existent project"""
-        with pytest.raises(RillError):
-            client.projects.get("nonexistent-project-12345")
-
-    def test_get_resources_for_invalid_project(self, client):
-        """Test getting resources for invalid project"""
+    @pytest.mark.parametrize(
+        "call",
+        [
+            lambda c: c.orgs.get("nonexistent-org-12345"),
+            lambda c: c.projects.get("nonexistent-project-12345"),
+            lambda c: c.projects.get_resources("nonexistent-project", org="nonexistent-org"),
+        ],
+        ids=["nonexistent_org", "nonexistent_project", "resources_for_invalid_project"],
+    )
+    def test_not_found(self, client, call):
+        """Test that looking up non-existent orgs, projects and resources raises RillError"""
         with pytest.raises(RillError):
-            client.projects.get_resources(
-                "nonexistent-project",
-                org="nonexistent-org"
-            )
+            call(client)
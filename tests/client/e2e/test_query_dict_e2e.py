@@ -5,50 +5,169 @@ These tests verify that passing plain Python dicts works identically to
 using Pydantic model objects. They require RILL_USER_TOKEN environment variable.
 
 Run with: pytest tests/client/e2e/test_query_dict_e2e.py --run-e2e -v -s
+
+Result files under tests/fixtures/query_results/dict/ are only (re)written
+when PYRILL_E2E_SAVE=1 is set; otherwise the tests just assert on the API
+responses. Each test saves to its own result file, so the module is safe to run under
+pytest-xdist: pytest tests/client/e2e --run-e2e -n auto --dist=loadfile
 """
 
-import os
 import json
+import os
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import pytest
 
-from pyrill import RillClient
+from pyrill.exceptions import RillAPIError
+from pyrill.models import QueryResult
+from tests.client.e2e.conftest import TEST_ORG, TEST_PROJECT, TEST_METRICS_VIEW, coerce_row, dump_json, write_bytes_atomic
+
+
+# Output directory for test results, resolved once at import
+_HERE = Path(__file__).resolve().parent
+OUTPUT_DIR = _HERE.parent.parent / "fixtures" / "query_results" / "dict"
+
+# Serializing result rows is the most expensive step of these tests; opt in to it
+_SAVE = bool(os.environ.get("PYRILL_E2E_SAVE"))
+
+
+# Static query skeletons, built once at import. Tests shallow-copy them and
+# fill in "time_range" (the placeholder keeps the key order of the saved query).
+_BASIC_Q = {
+    "metrics_view": TEST_METRICS_VIEW,
+    "dimensions": [
+        {"name": "advertiser_name"},
+        {"name": "device_type"}
+    ],
+    "measures": [
+        {"name": "overall_spend"},
+        {"name": "total_bids"},
+        {"name": "impressions"},
+        {"name": "win_rate"}
+    ],
+    "time_range": None,  # filled in per test
+    "sort": [{"name": "overall_spend", "desc": True}],
+    "limit": 20
+}
+
+_COMPLEX_Q = {
+    "metrics_view": TEST_METRICS_VIEW,
+    "dimensions": [
+        {
+            "name": "timestamp_day",
+            "compute": {
+                "time_floor": {
+                    "dimension": "__time",
+                    "grain": "day"
+                }
+            }
+        },
+        {"name": "advertiser_name"}
+    ],
+    "measures": [
+        {"name": "overall_spend"},
+        {"name": "total_bids"},
+        {"name": "win_rate"}
+    ],
+    "where": {
+        "cond": {
+            "op": "eq",
+            "exprs": [
+                {"name": "device_type"},
+                {"val": "Mobile/Tablet"}
+            ]
+        }
+    },
+    "time_range": None,  # filled in per test
+    "sort": [
+        {"name": "timestamp_day", "desc": False},
+        {"name": "overall_spend", "desc": True}
+    ],
+    "limit": 50
+}
+
+_AND_Q = {
+    "metrics_view": TEST_METRICS_VIEW,
+    "dimensions": [
+        {"name": "advertiser_name"},
+        {"name": "device_type"},
+        {"name": "device_region"}
+    ],
+    "measures": [
+        {"name": "overall_spend"},
+        {"name": "total_bids"},
+        {"name": "impressions"}
+    ],
+    "where": {
+        "cond": {
+            "op": "and",
+            "exprs": [
+                {
+                    "cond": {
+                        "op": "eq",
+                        "exprs": [
+                            {"name": "device_type"},
+                            {"val": "Mobile/Tablet"}
+                        ]
+                    }
+                },
+                {
+                    "cond": {
+                        "op": "in",
+                        "exprs": [
+                            {"name": "device_region"},
+                            {"val": ["US", "GB", "CA"]}
+                        ]
+                    }
+                }
+            ]
+        }
+    },
+    "time_range": None,  # filled in per test
+    "sort": [{"name": "overall_spend", "desc": True}],
+    "limit": 30
+}
+
+# SQL kept on a single line so the request payload carries no escaped newlines/indentation
+_METRICS_SQL = "SELECT advertiser_name, device_type, overall_spend, total_bids FROM bids_metrics ORDER BY overall_spend DESC LIMIT 20"
 
+_STATS_SQL = (
+    "SELECT COUNT(*) as total_rows, COUNT(DISTINCT advertiser_name) as unique_advertisers, "
+    "COUNT(DISTINCT campaign_name) as unique_campaigns, COUNT(DISTINCT device_type) as unique_device_types, "
+    "MIN(__time) as earliest_date, MAX(__time) as latest_date FROM bids_data_model"
+)
 
-# Test configuration
-TEST_ORG = "demo"
-TEST_PROJECT = "rill-openrtb-prog-ads"
-TEST_METRICS_VIEW = "bids_metrics"
 
-# Output directory for test results
-OUTPUT_DIR = Path(__file__).parent.parent.parent / "fixtures" / "query_results" / "dict"
+@pytest.fixture(scope="session")
+def output_dir():
+    """Create output directory for test results once per session"""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    return OUTPUT_DIR
 
 
 @pytest.fixture(scope="module")
-def real_client():
-    """Create a real RillClient using RILL_USER_TOKEN from environment"""
-    token = os.environ.get("RILL_USER_TOKEN")
-    if not token:
-        pytest.skip("RILL_USER_TOKEN not set")
+def time_anchor():
+    """
+    Return window(days) -> (start_iso, end_iso) for a time range ending at
+    midnight UTC two days ago.
 
-    client = RillClient(
-        api_token=token,
-        org=TEST_ORG,
-        project=TEST_PROJECT
-    )
-    return client
+    The anchor is computed once per module so every test queries a window
+    with the same end.
+    """
+    end = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
+    end_iso = end.isoformat()
 
+    def window(days: int):
+        return (end - timedelta(days=days)).isoformat(), end_iso
 
-@pytest.fixture(scope="module")
-def output_dir():
-    """Create output directory for test results"""
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    return OUTPUT_DIR
+    return window
 
 
-def save_result(output_dir: Path, test_name: str, query: dict, result: dict, metadata: dict = None, subfolder: str = None):
-    """Save query and result to JSON file"""
+def save_result(output_dir: Path, test_name: str, query: dict, result: QueryResult, metadata: dict = None, subfolder: str = None):
+    """Save query and result to JSON file (the result model is serialized by pydantic, not re-walked)"""
+    if not _SAVE:
+        return None
+
     output = {
         "test_name": test_name,
         "org": TEST_ORG,
@@ -68,19 +187,19 @@ def save_result(output_dir: Path, test_name: str, query: dict, result: dict, met
     filename = f"{test_name}.json"
     filepath = target_dir / filename
 
-    with open(filepath, "w") as f:
-        json.dump(output, f, indent=2, default=str)
+    write_bytes_atomic(filepath, dump_json(output))
 
     print(f"\n✓ Saved result to: {filepath}")
-    print(f"  - Rows returned: {len(result.get('data', []))}")
-    if result.get('data'):
-        print(f"  - Sample row: {json.dumps(result['data'][0], default=str)}")
+    print(f"  - Rows returned: {len(result.data)}")
+    if result.data:
+        print(f"  - Sample row: {json.dumps(coerce_row(result.data[0]))}")
     return filepath
 
 
 def save_error(output_dir: Path, test_name: str, query: dict, error: Exception, metadata: dict = None, subfolder: str = None):
     """Save query and error details to JSON file"""
-    from pyrill.exceptions import RillAPIError
+    if not _SAVE:
+        return None
 
     error_data = {
         "error_type": type(error).__name__,
@@ -112,8 +231,7 @@ def save_error(output_dir: Path, test_name: str, query: dict, error: Exception,
     filename = f"{test_name}_ERROR.json"
     filepath = target_dir / filename
 
-    with open(filepath, "w") as f:
-        json.dump(output, f, indent=2, default=str)
+    write_bytes_atomic(filepath, dump_json(output))
 
     print(f"\n✗ Saved error to: {filepath}")
     print(f"  - Error type: {error_data['error_type']}")
@@ -126,32 +244,13 @@ def save_error(output_dir: Path, test_name: str, query: dict, error: Exception,
 class TestMetricsQueryDictE2E:
     """E2E tests for metrics queries using plain Python dicts"""
 
-    def test_basic_metrics_query_dict(self, real_client, output_dir):
+    def test_basic_metrics_query_dict(self, real_client, output_dir, time_anchor):
         """Test basic metrics query using a plain Python dict"""
         # Query last 3 days of data
-        end_date = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date = (end_date - timedelta(days=3)).replace(hour=0, minute=0, second=0, microsecond=0)
+        start, end = time_anchor(3)
 
         # Plain dict - no Pydantic models!
-        query_dict = {
-            "metrics_view": TEST_METRICS_VIEW,
-            "dimensions": [
-                {"name": "advertiser_name"},
-                {"name": "device_type"}
-            ],
-            "measures": [
-                {"name": "overall_spend"},
-                {"name": "total_bids"},
-                {"name": "impressions"},
-                {"name": "win_rate"}
-            ],
-            "time_range": {
-                "start": start_date.isoformat(),
-                "end": end_date.isoformat()
-            },
-            "sort": [{"name": "overall_spend", "desc": True}],
-            "limit": 20
-        }
+        query_dict = {**_BASIC_Q, "time_range": {"start": start, "end": end}}
 
         # Pass dict directly to metrics()
         result = real_client.queries.metrics(query_dict)
@@ -161,10 +260,10 @@ class TestMetricsQueryDictE2E:
             output_dir,
             "basic_metrics_query_dict",
             query_dict,
-            {"data": result.data},
+            result,
             {
                 "description": "Basic metrics query using plain Python dict",
-                "time_range": f"{start_date.date()} to {end_date.date()}"
+                "time_range": f"{start[:10]} to {end[:10]}"
             },
             subfolder="metrics"
         )
@@ -173,50 +272,12 @@ class TestMetricsQueryDictE2E:
         assert isinstance(result.data, list)
         print(f"\n✓ Retrieved {len(result.data)} rows using dict query")
 
-    def test_complex_metrics_query_dict(self, real_client, output_dir):
+    def test_complex_metrics_query_dict(self, real_client, output_dir, time_anchor):
         """Test complex metrics query with time_floor and filters using dict"""
-        end_date = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date = (end_date - timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0)
+        start, end = time_anchor(7)
 
         # Complex dict with nested structures
-        query_dict = {
-            "metrics_view": TEST_METRICS_VIEW,
-            "dimensions": [
-                {
-                    "name": "timestamp_day",
-                    "compute": {
-                        "time_floor": {
-                            "dimension": "__time",
-                            "grain": "day"
-                        }
-                    }
-                },
-                {"name": "advertiser_name"}
-            ],
-            "measures": [
-                {"name": "overall_spend"},
-                {"name": "total_bids"},
-                {"name": "win_rate"}
-            ],
-            "where": {
-                "cond": {
-                    "op": "eq",
-                    "exprs": [
-                        {"name": "device_type"},
-                        {"val": "Mobile/Tablet"}
-                    ]
-                }
-            },
-            "time_range": {
-                "start": start_date.isoformat(),
-                "end": end_date.isoformat()
-            },
-            "sort": [
-                {"name": "timestamp_day", "desc": False},
-                {"name": "overall_spend", "desc": True}
-            ],
-            "limit": 50
-        }
+        query_dict = {**_COMPLEX_Q, "time_range": {"start": start, "end": end}}
 
         result = real_client.queries.metrics(query_dict)
 
@@ -224,10 +285,10 @@ class TestMetricsQueryDictE2E:
             output_dir,
             "complex_metrics_query_dict",
             query_dict,
-            {"data": result.data},
+            result,
             {
                 "description": "Complex query with time_floor and filters using dict",
-                "time_range": f"{start_date.date()} to {end_date.date()}"
+                "time_range": f"{start[:10]} to {end[:10]}"
             },
             subfolder="metrics"
         )
@@ -235,55 +296,11 @@ class TestMetricsQueryDictE2E:
         assert result is not None
         print(f"\n✓ Retrieved {len(result.data)} rows using complex dict query")
 
-    def test_metrics_query_complex_and_filter_dict(self, real_client, output_dir):
+    def test_metrics_query_complex_and_filter_dict(self, real_client, output_dir, time_anchor):
         """Test metrics query with complex AND filter using dict"""
-        end_date = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date = (end_date - timedelta(days=4)).replace(hour=0, minute=0, second=0, microsecond=0)
+        start, end = time_anchor(4)
 
-        query_dict = {
-            "metrics_view": TEST_METRICS_VIEW,
-            "dimensions": [
-                {"name": "advertiser_name"},
-                {"name": "device_type"},
-                {"name": "device_region"}
-            ],
-            "measures": [
-                {"name": "overall_spend"},
-                {"name": "total_bids"},
-                {"name": "impressions"}
-            ],
-            "where": {
-                "cond": {
-                    "op": "and",
-                    "exprs": [
-                        {
-                            "cond": {
-                                "op": "eq",
-                                "exprs": [
-                                    {"name": "device_type"},
-                                    {"val": "Mobile/Tablet"}
-                                ]
-                            }
-                        },
-                        {
-                            "cond": {
-                                "op": "in",
-                                "exprs": [
-                                    {"name": "device_region"},
-                                    {"val": ["US", "GB", "CA"]}
-                                ]
-                            }
-                        }
-                    ]
-                }
-            },
-            "time_range": {
-                "start": start_date.isoformat(),
-                "end": end_date.isoformat()
-            },
-            "sort": [{"name": "overall_spend", "desc": True}],
-            "limit": 30
-        }
+        query_dict = {**_AND_Q, "time_range": {"start": start, "end": end}}
 
         result = real_client.queries.metrics(query_dict)
 
@@ -291,7 +308,7 @@ class TestMetricsQueryDictE2E:
             output_dir,
             "metrics_query_complex_and_filter_dict",
             query_dict,
-            {"data": result.data},
+            result,
             {
                 "description": "Complex AND filter using dict",
                 "filter": "device_type = 'Mobile/Tablet' AND device_region IN ('US', 'GB', 'CA')"
@@ -309,20 +326,7 @@ class TestMetricsSqlQueryDictE2E:
 
     def test_metrics_sql_query_dict(self, real_client, output_dir):
         """Test metrics SQL query using a plain Python dict"""
-        from pyrill.exceptions import RillAPIError
-
-        query_dict = {
-            "sql": """
-            SELECT
-                advertiser_name,
-                device_type,
-                overall_spend,
-                total_bids
-            FROM bids_metrics
-            ORDER BY overall_spend DESC
-            LIMIT 20
-            """
-        }
+        query_dict = {"sql": _METRICS_SQL}
 
         try:
             result = real_client.queries.metrics_sql(query_dict)
@@ -331,7 +335,7 @@ class TestMetricsSqlQueryDictE2E:
                 output_dir,
                 "metrics_sql_query_dict",
                 query_dict,
-                {"data": result.data},
+                result,
                 {
                     "description": "Metrics SQL query using plain Python dict - queries pre-aggregated metrics view",
                     "note": "Metrics-SQL queries the metrics view directly (no GROUP BY/aggregations needed)"
@@ -364,19 +368,7 @@ class TestSqlQueryDictE2E:
 
     def test_sql_query_dict(self, real_client, output_dir):
         """Test raw SQL query using a plain Python dict"""
-        query_dict = {
-            "sql": """
-            SELECT
-                COUNT(*) as total_rows,
-                COUNT(DISTINCT advertiser_name) as unique_advertisers,
-                COUNT(DISTINCT campaign_name) as unique_campaigns,
-                COUNT(DISTINCT device_type) as unique_device_types,
-                MIN(__time) as earliest_date,
-                MAX(__time) as latest_date
-            FROM bids_data_model
-            """,
-            "connector": "duckdb"
-        }
+        query_dict = {"sql": _STATS_SQL, "connector": "duckdb"}
 
         result = real_client.queries.sql(query_dict)
 
@@ -384,7 +376,7 @@ class TestSqlQueryDictE2E:
             output_dir,
             "sql_query_dict",
             query_dict,
-            {"data": result.data},
+            result,
             {
                 "description": "Raw SQL query using plain Python dict"
             },
@@ -394,7 +386,7 @@ class TestSqlQueryDictE2E:
         assert result is not None
         print(f"\n✓ Retrieved {len(result.data)} rows using raw SQL dict")
         if result.data:
-            print(f"  Dataset stats: {json.dumps(result.data[0], indent=2, default=str)}")
+            print(f"  Dataset stats: {json.dumps(coerce_row(result.data[0]), indent=2)}")
 
 
 @pytest.mark.e2e
@@ -403,8 +395,6 @@ class TestDictValidationE2E:
 
     def test_invalid_metrics_query_dict(self, real_client):
         """Test that invalid dicts raise appropriate validation errors"""
-        from pyrill.exceptions import RillAPIError
-
         # Missing required field (metrics_view)
         invalid_dict = {
             "dimensions": [{"name": "advertiser_name"}],
@@ -419,8 +409,6 @@ class TestDictValidationE2E:
 
     def test_invalid_sql_query_dict(self, real_client):
         """Test that invalid SQL dicts raise appropriate validation errors"""
-        from pyrill.exceptions import RillAPIError
-
         # Missing required field (sql)
         invalid_dict = {
             "connector": "duckdb"
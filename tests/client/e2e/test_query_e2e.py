@@ -5,14 +5,16 @@ These tests require RILL_USER_TOKEN environment variable and make real API calls
 Run with: pytest tests/client/e2e/test_query_e2e.py --run-e2e -v -s
 """
 
-import os
 import json
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, List
 import pytest
 
 from pyrill import (
-    RillClient,
     QueryBuilder,
     MetricsQuery,
     MetricsSqlQuery,
@@ -28,30 +30,328 @@ from pyrill import (
     DimensionCompute,
     DimensionComputeTimeFloor,
 )
+from pyrill.exceptions import RillAPIError
+from tests.client.e2e.conftest import TEST_ORG, TEST_PROJECT, TEST_METRICS_VIEW, WriteQueue, coerce_row, dump_json, write_bytes_atomic
 
 
-# Test configuration
-TEST_ORG = "demo"
-TEST_PROJECT = "rill-openrtb-prog-ads"
-TEST_METRICS_VIEW = "bids_metrics"
+# metrics_results fires the whole batch once per module; keep the module on one
+# xdist worker so other workers don't repeat it
+pytestmark = pytest.mark.xdist_group("query_e2e")
 
 # Output directory for test results
 OUTPUT_DIR = Path(__file__).parent.parent.parent / "fixtures" / "query_results" / "object"
 
 
-@pytest.fixture(scope="module")
-def real_client():
-    """Create a real RillClient using RILL_USER_TOKEN from environment"""
-    token = os.environ.get("RILL_USER_TOKEN")
-    if not token:
-        pytest.skip("RILL_USER_TOKEN not set")
+def _floor_day(d: datetime) -> datetime:
+    """Return midnight UTC of the day containing `d`"""
+    return datetime.combine(d.date(), time.min, tzinfo=timezone.utc)
+
+
+# "Now" is frozen once per module: every test's time window ends at the same
+# midnight UTC (two days back), so repeated windows can hit the server's query cache
+_WINDOW_END = _floor_day(datetime.now(timezone.utc) - timedelta(days=2))
+
+
+@lru_cache(maxsize=8)
+def _iso_window(days: int) -> Dict[str, str]:
+    """
+    Return {"start": ..., "end": ...} ISO strings for a window of `days` days
+    ending at _WINDOW_END.
+
+    Cached per distinct `days`; the dict is shared, so callers must not mutate it.
+    """
+    return {"start": (_WINDOW_END - timedelta(days=days)).isoformat(), "end": _WINDOW_END.isoformat()}
+
+
+def _window_note(query: MetricsQuery) -> str:
+    """Describe an absolute query time range as 'YYYY-MM-DD to YYYY-MM-DD' for saved metadata"""
+    return f"{query.time_range.start[:10]} to {query.time_range.end[:10]}"
+
+
+# TestMetricsQueryE2E queries, keyed by test name. They are built once at
+# import so the metrics_results fixture can dispatch them all concurrently.
+_METRICS_QUERIES = {
+    # Last 3 days of data
+    "basic_metrics_query": MetricsQuery(
+        metrics_view=TEST_METRICS_VIEW,
+        dimensions=[
+            Dimension(name="advertiser_name"),
+            Dimension(name="device_type")
+        ],
+        measures=[
+            Measure(name="overall_spend"),
+            Measure(name="total_bids"),
+            Measure(name="impressions"),
+            Measure(name="win_rate")
+        ],
+        time_range=TimeRange(**_iso_window(3)),
+        sort=[Sort(name="overall_spend", desc=True)],
+        limit=20
+    ),
+    # Last 7 days with daily granularity
+    "metrics_query_time_dimension": MetricsQuery(
+        metrics_view=TEST_METRICS_VIEW,
+        dimensions=[
+            Dimension(
+                name="timestamp_day",
+                compute=DimensionCompute(
+                    time_floor=DimensionComputeTimeFloor(
+                        dimension="__time",
+                        grain=TimeGrain.DAY
+                    )
+                )
+            ),
+            Dimension(name="advertiser_name")
+        ],
+        measures=[
+            Measure(name="overall_spend"),
+            Measure(name="total_bids"),
+            Measure(name="win_rate")
+        ],
+        time_range=TimeRange(**_iso_window(7)),
+        sort=[
+            Sort(name="timestamp_day", desc=False),
+            Sort(name="overall_spend", desc=True)
+        ],
+        limit=100
+    ),
+    "metrics_query_with_filter": MetricsQuery(
+        metrics_view=TEST_METRICS_VIEW,
+        dimensions=[
+            Dimension(name="advertiser_name"),
+            Dimension(name="campaign_name")
+        ],
+        measures=[
+            Measure(name="overall_spend"),
+            Measure(name="total_bids"),
+            Measure(name="clicks"),
+            Measure(name="ctr")
+        ],
+        where=Expression(
+            cond=Condition(
+                op=Operator.EQ,
+                exprs=[
+                    Expression(name="device_type"),
+                    Expression(val="mobile")
+                ]
+            )
+        ),
+        time_range=TimeRange(**_iso_window(5)),
+        sort=[Sort(name="overall_spend", desc=True)],
+        limit=30
+    ),
+    "metrics_query_iso_duration_time_range": MetricsQuery(
+        metrics_view=TEST_METRICS_VIEW,
+        dimensions=[
+            Dimension(name="advertiser_name"),
+            Dimension(name="device_type"),
+            Dimension(name="creative_type")
+        ],
+        measures=[
+            Measure(name="overall_spend"),
+            Measure(name="impressions"),
+            Measure(name="video_completes"),
+            Measure(name="video_completion_rate")
+        ],
+        time_range=TimeRange(iso_duration="P7D"),
+        sort=[Sort(name="video_completes", desc=True)],
+        limit=25
+    ),
+    "metrics_query_expression_time_range": MetricsQuery(
+        metrics_view=TEST_METRICS_VIEW,
+        dimensions=[
+            Dimension(name="advertiser_name"),
+            Dimension(name="device_type"),
+            Dimension(name="creative_type")
+        ],
+        measures=[
+            Measure(name="overall_spend"),
+            Measure(name="impressions"),
+            Measure(name="video_completes"),
+            Measure(name="video_completion_rate")
+        ],
+        time_range=TimeRange(expression="P7D"),
+        sort=[Sort(name="video_completes", desc=True)],
+        limit=25
+    ),
+    "metrics_query_complex_filter": MetricsQuery(
+        metrics_view=TEST_METRICS_VIEW,
+        dimensions=[
+            Dimension(name="advertiser_name"),
+            Dimension(name="device_type"),
+            Dimension(name="device_region")
+        ],
+        measures=[
+            Measure(name="overall_spend"),
+            Measure(name="total_bids"),
+            Measure(name="impressions"),
+            Measure(name="clicks"),
+            Measure(name="ctr")
+        ],
+        where=Expression(
+            cond=Condition(
+                op=Operator.AND,
+                exprs=[
+                    Expression(
+                        cond=Condition(
+                            op=Operator.EQ,
+                            exprs=[
+                                Expression(name="device_type"),
+                                Expression(val="mobile")
+                            ]
+                        )
+                    ),
+                    Expression(
+                        cond=Condition(
+                            op=Operator.IN,
+                            exprs=[
+                                Expression(name="device_region"),
+                                Expression(val=["US", "GB", "CA"])
+                            ]
+                        )
+                    )
+                ]
+            )
+        ),
+        time_range=TimeRange(**_iso_window(4)),
+        sort=[Sort(name="overall_spend", desc=True)],
+        limit=50
+    ),
+    # Last 7 days with daily granularity, via the fluent API
+    "query_builder_time_dimension": (
+        QueryBuilder()
+        .metrics_view(TEST_METRICS_VIEW)
+        .dimension(
+            "timestamp_day",
+            {"time_floor": {"dimension": "__time", "grain": "day"}}
+        )
+        .dimension("advertiser_name")
+        .measures(["overall_spend", "total_bids", "win_rate"])
+        .time_range(_iso_window(7))
+        .sorts([
+            {"name": "timestamp_day", "desc": False},
+            {"name": "overall_spend", "desc": True}
+        ])
+        .limit(100)
+        .build()
+    ),
+    "query_builder_complex_filter": (
+        QueryBuilder()
+        .metrics_view(TEST_METRICS_VIEW)
+        .dimensions(["advertiser_name", "device_type", "device_region"])
+        .measures(["overall_spend", "total_bids", "impressions", "clicks", "ctr"])
+        .where({
+            "op": "and",
+            "conditions": [
+                {"op": "eq", "field": "device_type", "value": "mobile"},
+                {"op": "in", "field": "device_region", "values": ["US", "GB", "CA"]}
+            ]
+        })
+        .time_range(_iso_window(4))
+        .sort("overall_spend", desc=True)
+        .limit(50)
+        .build()
+    ),
+}
+
+
+# JSON-ready query payloads for the saved result files, dumped once at import.
+# Shared across tests, so they must not be mutated.
+_METRICS_QUERY_DICTS = {
+    name: query.model_dump(mode="json", exclude_none=True)
+    for name, query in _METRICS_QUERIES.items()
+}
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    """A TestMetricsQueryE2E case: the _METRICS_QUERIES entry to run and how to label its saved result"""
+    name: str
+    description: str
+    subfolder: str = "metrics"
+    metadata: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def query(self) -> MetricsQuery:
+        return _METRICS_QUERIES[self.name]
+
+    @property
+    def query_dict(self) -> dict:
+        return _METRICS_QUERY_DICTS[self.name]
+
+
+_MOBILE_IN_REGIONS = "device_type = 'mobile' AND device_region IN ('US', 'GB', 'CA')"
+
+QUERY_SPECS: List[QuerySpec] = [
+    QuerySpec("basic_metrics_query", "Basic metrics query with advertiser and device dimensions"),
+    QuerySpec("metrics_query_time_dimension", "Time-series query with daily granularity by advertiser"),
+    QuerySpec(
+        "metrics_query_with_filter",
+        "Mobile device campaigns sorted by spend",
+        metadata={"filter": "device_type = 'mobile'"}
+    ),
+    QuerySpec(
+        "metrics_query_iso_duration_time_range",
+        "Video performance metrics over last 7 days using iso_duration parameter",
+        metadata={"time_range": "iso_duration='P7D'"}
+    ),
+    QuerySpec(
+        "metrics_query_expression_time_range",
+        "Video performance metrics using expression parameter",
+        metadata={
+            "time_range": "expression='P7D'",
+            "note": "Testing if expression parameter works differently than iso_duration"
+        }
+    ),
+    QuerySpec(
+        "metrics_query_complex_filter",
+        "Mobile campaigns in US, GB, CA regions",
+        metadata={"filter": _MOBILE_IN_REGIONS}
+    ),
+    QuerySpec(
+        "query_builder_time_dimension",
+        "QueryBuilder: Time-series query with daily granularity by advertiser",
+        subfolder="builder",
+        metadata={"note": "Built using QueryBuilder fluent API"}
+    ),
+    QuerySpec(
+        "query_builder_complex_filter",
+        "QueryBuilder: Mobile campaigns in US, GB, CA regions",
+        subfolder="builder",
+        metadata={"filter": _MOBILE_IN_REGIONS, "note": "Built using QueryBuilder fluent API with dict-based filters"}
+    ),
+]
+
+
+# SQL query models, validated once at import like _METRICS_QUERIES
+_METRICS_SQL_QUERY = MetricsSqlQuery(
+    sql="""
+    SELECT
+        advertiser_name,
+        device_type,
+        overall_spend,
+        total_bids
+    FROM bids_metrics
+    ORDER BY overall_spend DESC
+    LIMIT 20
+    """
+)
+
+_SQL_QUERY = SqlQuery(
+    sql="""
+    SELECT
+        COUNT(*) as total_rows,
+        COUNT(DISTINCT advertiser_name) as unique_advertisers,
+        COUNT(DISTINCT campaign_name) as unique_campaigns,
+        MIN(__time) as earliest_date,
+        MAX(__time) as latest_date
+    FROM bids_data_model
+    """,
+    connector="duckdb"
+)
 
-    client = RillClient(
-        api_token=token,
-        org=TEST_ORG,
-        project=TEST_PROJECT
-    )
-    return client
+_METRICS_SQL_QUERY_DICT = {"sql": _METRICS_SQL_QUERY.sql}
+_SQL_QUERY_DICT = {"sql": _SQL_QUERY.sql, "connector": _SQL_QUERY.connector}
 
 
 @pytest.fixture(scope="module")
@@ -61,12 +361,35 @@ def output_dir():
     return OUTPUT_DIR
 
 
-def save_result(output_dir: Path, test_name: str, query: dict, result: dict, metadata: dict = None, subfolder: str = None):
+@pytest.fixture(scope="module")
+def metrics_results(real_client):
+    """
+    Run every _METRICS_QUERIES query concurrently, once per module.
+
+    Returns test name -> Future. The module's sequential round-trips collapse
+    to roughly the slowest single query; Future.result() returns the
+    QueryResult or re-raises that query's RillAPIError.
+    """
+    with ThreadPoolExecutor(max_workers=min(8, len(_METRICS_QUERIES))) as pool:
+        return {
+            name: pool.submit(real_client.queries.metrics, query)
+            for name, query in _METRICS_QUERIES.items()
+        }
+
+
+# Fields shared by every saved result/error file, built once and spliced in
+_OUTPUT_HEADER = {"org": TEST_ORG, "project": TEST_PROJECT}
+
+def _write_output(filepath: Path, output: dict) -> None:
+    """Write output as indented JSON, the layout of the checked-in result fixtures"""
+    write_bytes_atomic(filepath, dump_json(output))
+
+
+def save_result(write_queue: WriteQueue, output_dir: Path, test_name: str, query: dict, result: dict, metadata: dict = None, subfolder: str = None):
     """Save query and result to JSON file"""
     output = {
         "test_name": test_name,
-        "org": TEST_ORG,
-        "project": TEST_PROJECT,
+        **_OUTPUT_HEADER,
         "query": query,
         "result": result,
         "metadata": metadata or {}
@@ -82,20 +405,17 @@ def save_result(output_dir: Path, test_name: str, query: dict, result: dict, met
     filename = f"{test_name}.json"
     filepath = target_dir / filename
 
-    with open(filepath, "w") as f:
-        json.dump(output, f, indent=2, default=str)
+    write_queue.submit(_write_output, filepath, output)
 
-    print(f"\n✓ Saved result to: {filepath}")
+    print(f"\n✓ Queued result for: {filepath}")
     print(f"  - Rows returned: {len(result.get('data', []))}")
     if result.get('data'):
-        print(f"  - Sample row: {json.dumps(result['data'][0], default=str)}")
+        print(f"  - Sample row: {json.dumps(coerce_row(result['data'][0]))}")
     return filepath
 
 
-def save_error(output_dir: Path, test_name: str, query: dict, error: Exception, metadata: dict = None, subfolder: str = None):
+def save_error(write_queue: WriteQueue, output_dir: Path, test_name: str, query: dict, error: Exception, metadata: dict = None, subfolder: str = None):
     """Save query and error details to JSON file"""
-    from pyrill.exceptions import RillAPIError
-
     error_data = {
         "error_type": type(error).__name__,
         "error_message": str(error),
@@ -108,8 +428,7 @@ def save_error(output_dir: Path, test_name: str, query: dict, error: Exception,
 
     output = {
         "test_name": test_name,
-        "org": TEST_ORG,
-        "project": TEST_PROJECT,
+        **_OUTPUT_HEADER,
         "query": query,
         "error": error_data,
         "metadata": metadata or {},
@@ -126,10 +445,9 @@ def save_error(output_dir: Path, test_name: str, query: dict, error: Exception,
     filename = f"{test_name}_ERROR.json"
     filepath = target_dir / filename
 
-    with open(filepath, "w") as f:
-        json.dump(output, f, indent=2, default=str)
+    write_queue.submit(_write_output, filepath, output)
 
-    print(f"\n✗ Saved error to: {filepath}")
+    print(f"\n✗ Queued error for: {filepath}")
     print(f"  - Error type: {error_data['error_type']}")
     print(f"  - Status code: {error_data.get('status_code', 'N/A')}")
     print(f"  - Message: {error_data['error_message']}")
@@ -138,440 +456,70 @@ def save_error(output_dir: Path, test_name: str, query: dict, error: Exception,
 
 @pytest.mark.e2e
 class TestMetricsQueryE2E:
-    """E2E tests for metrics queries"""
-
-    def test_basic_metrics_query(self, real_client, output_dir):
-        """Test basic metrics query with dimensions and measures"""
-        # Query last 3 days of data
-        end_date = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date = (end_date - timedelta(days=3)).replace(hour=0, minute=0, second=0, microsecond=0)
-
-        query = MetricsQuery(
-            metrics_view=TEST_METRICS_VIEW,
-            dimensions=[
-                Dimension(name="advertiser_name"),
-                Dimension(name="device_type")
-            ],
-            measures=[
-                Measure(name="overall_spend"),
-                Measure(name="total_bids"),
-                Measure(name="impressions"),
-                Measure(name="win_rate")
-            ],
-            time_range=TimeRange(
-                start=start_date.isoformat(),
-                end=end_date.isoformat()
-            ),
-            sort=[Sort(name="overall_spend", desc=True)],
-            limit=20
-        )
-
-        result = real_client.queries.metrics(query)
-
-        # Save results
-        save_result(
-            output_dir,
-            "basic_metrics_query",
-            query.model_dump(),
-            {"data": result.data},
-            {
-                "description": "Basic metrics query with advertiser and device dimensions",
-                "time_range": f"{start_date.date()} to {end_date.date()}"
-            },
-            subfolder="metrics"
-        )
-
-        assert result is not None
-        assert isinstance(result.data, list)
-        print(f"\n✓ Retrieved {len(result.data)} rows")
-
-    def test_metrics_query_with_time_dimension(self, real_client, output_dir):
-        """Test metrics query with time-based dimension"""
-        # Query last 7 days with daily granularity
-        end_date = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date = (end_date - timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0)
-
-        query = MetricsQuery(
-            metrics_view=TEST_METRICS_VIEW,
-            dimensions=[
-                Dimension(
-                    name="timestamp_day",
-                    compute=DimensionCompute(
-                        time_floor=DimensionComputeTimeFloor(
-                            dimension="__time",
-                            grain=TimeGrain.DAY
-                        )
-                    )
-                ),
-                Dimension(name="advertiser_name")
-            ],
-            measures=[
-                Measure(name="overall_spend"),
-                Measure(name="total_bids"),
-                Measure(name="win_rate")
-            ],
-            time_range=TimeRange(
-                start=start_date.isoformat(),
-                end=end_date.isoformat()
-            ),
-            sort=[
-                Sort(name="timestamp_day", desc=False),
-                Sort(name="overall_spend", desc=True)
-            ],
-            limit=100
-        )
-
-        result = real_client.queries.metrics(query)
-
-        save_result(
-            output_dir,
-            "metrics_query_time_dimension",
-            query.model_dump(),
-            {"data": result.data},
-            {
-                "description": "Time-series query with daily granularity by advertiser",
-                "time_range": f"{start_date.date()} to {end_date.date()}"
-            },
-            subfolder="metrics"
-        )
-
-        assert result is not None
-        print(f"\n✓ Retrieved {len(result.data)} time-series rows")
-
-    def test_metrics_query_with_filter(self, real_client, output_dir):
-        """Test metrics query with WHERE filter"""
-        end_date = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date = (end_date - timedelta(days=5)).replace(hour=0, minute=0, second=0, microsecond=0)
-
-        query = MetricsQuery(
-            metrics_view=TEST_METRICS_VIEW,
-            dimensions=[
-                Dimension(name="advertiser_name"),
-                Dimension(name="campaign_name")
-            ],
-            measures=[
-                Measure(name="overall_spend"),
-                Measure(name="total_bids"),
-                Measure(name="clicks"),
-                Measure(name="ctr")
-            ],
-            where=Expression(
-                cond=Condition(
-                    op=Operator.EQ,
-                    exprs=[
-                        Expression(name="device_type"),
-                        Expression(val="mobile")
-                    ]
-                )
-            ),
-            time_range=TimeRange(
-                start=start_date.isoformat(),
-                end=end_date.isoformat()
-            ),
-            sort=[Sort(name="overall_spend", desc=True)],
-            limit=30
-        )
-
-        result = real_client.queries.metrics(query)
-
-        save_result(
-            output_dir,
-            "metrics_query_with_filter",
-            query.model_dump(),
-            {"data": result.data},
-            {
-                "description": "Mobile device campaigns sorted by spend",
-                "filter": "device_type = 'mobile'",
-                "time_range": f"{start_date.date()} to {end_date.date()}"
-            },
-            subfolder="metrics"
-        )
-
-        assert result is not None
-        print(f"\n✓ Retrieved {len(result.data)} filtered rows (mobile only)")
-
-    def test_metrics_query_with_iso_duration_time_range(self, real_client, output_dir):
-        """Test metrics query with ISO 8601 duration using iso_duration parameter"""
-        query = MetricsQuery(
-            metrics_view=TEST_METRICS_VIEW,
-            dimensions=[
-                Dimension(name="advertiser_name"),
-                Dimension(name="device_type"),
-                Dimension(name="creative_type")
-            ],
-            measures=[
-                Measure(name="overall_spend"),
-                Measure(name="impressions"),
-                Measure(name="video_completes"),
-                Measure(name="video_completion_rate")
-            ],
-            time_range=TimeRange(iso_duration="P7D"),
-            sort=[Sort(name="video_completes", desc=True)],
-            limit=25
-        )
-
-        result = real_client.queries.metrics(query)
-
-        save_result(
-            output_dir,
-            "metrics_query_iso_duration_time_range",
-            query.model_dump(),
-            {"data": result.data},
-            {
-                "description": "Video performance metrics over last 7 days using iso_duration parameter",
-                "time_range": "iso_duration='P7D'"
-            },
-            subfolder="metrics"
-        )
-
-        assert result is not None
-        print(f"\n✓ Retrieved {len(result.data)} rows (iso_duration='P7D')")
-
-    def test_metrics_query_with_expression_time_range(self, real_client, output_dir):
-        """Test metrics query with time range using expression parameter"""
-        from pyrill.exceptions import RillAPIError
-
-        query = MetricsQuery(
-            metrics_view=TEST_METRICS_VIEW,
-            dimensions=[
-                Dimension(name="advertiser_name"),
-                Dimension(name="device_type"),
-                Dimension(name="creative_type")
-            ],
-            measures=[
-                Measure(name="overall_spend"),
-                Measure(name="impressions"),
-                Measure(name="video_completes"),
-                Measure(name="video_completion_rate")
-            ],
-            time_range=TimeRange(expression="P7D"),
-            sort=[Sort(name="video_completes", desc=True)],
-            limit=25
-        )
+    """
+    E2E tests for metrics queries
+
+    One parametrized test per QUERY_SPECS entry. The queries are dispatched
+    together by the metrics_results fixture; each case only collects its own
+    result, saves it and asserts on it.
+    """
+
+    @pytest.mark.parametrize("spec", QUERY_SPECS, ids=lambda spec: spec.name)
+    def test_metrics_query(self, spec, metrics_results, output_dir, write_queue):
+        """Test a metrics query spec end to end and save its result"""
+        query = spec.query
+        query_dict = spec.query_dict
+        metadata = {"description": spec.description, **spec.metadata}
+        if query.time_range.start:
+            metadata["time_range"] = _window_note(query)
 
         try:
-            result = real_client.queries.metrics(query)
-
-            save_result(
-                output_dir,
-                "metrics_query_expression_time_range",
-                query.model_dump(),
-                {"data": result.data},
-                {
-                    "description": "Video performance metrics using expression parameter",
-                    "time_range": "expression='P7D'"
-                },
-                subfolder="metrics"
-            )
-
-            assert result is not None
-            print(f"\n✓ Retrieved {len(result.data)} rows (expression='P7D')")
+            result = metrics_results[spec.name].result()
         except RillAPIError as e:
-            # Save error details for diagnosis
+            # Save error details for diagnosis, then re-raise to fail the test
             save_error(
+                write_queue,
                 output_dir,
-                "metrics_query_expression_time_range",
-                query.model_dump(),
+                spec.name,
+                query_dict,
                 e,
-                {
-                    "description": "Video performance metrics using expression parameter (FAILED)",
-                    "time_range": "expression='P7D'",
-                    "note": "Testing if expression parameter works differently than iso_duration"
-                },
-                subfolder="metrics"
+                {**metadata, "description": f"{spec.description} (FAILED)"},
+                subfolder=spec.subfolder
             )
-            # Re-raise to mark test as failed
             raise
 
-    def test_metrics_query_complex_filter(self, real_client, output_dir):
-        """Test metrics query with complex AND filter"""
-        end_date = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date = (end_date - timedelta(days=4)).replace(hour=0, minute=0, second=0, microsecond=0)
-
-        query = MetricsQuery(
-            metrics_view=TEST_METRICS_VIEW,
-            dimensions=[
-                Dimension(name="advertiser_name"),
-                Dimension(name="device_type"),
-                Dimension(name="device_region")
-            ],
-            measures=[
-                Measure(name="overall_spend"),
-                Measure(name="total_bids"),
-                Measure(name="impressions"),
-                Measure(name="clicks"),
-                Measure(name="ctr")
-            ],
-            where=Expression(
-                cond=Condition(
-                    op=Operator.AND,
-                    exprs=[
-                        Expression(
-                            cond=Condition(
-                                op=Operator.EQ,
-                                exprs=[
-                                    Expression(name="device_type"),
-                                    Expression(val="mobile")
-                                ]
-                            )
-                        ),
-                        Expression(
-                            cond=Condition(
-                                op=Operator.IN,
-                                exprs=[
-                                    Expression(name="device_region"),
-                                    Expression(val=["US", "GB", "CA"])
-                                ]
-                            )
-                        )
-                    ]
-                )
-            ),
-            time_range=TimeRange(
-                start=start_date.isoformat(),
-                end=end_date.isoformat()
-            ),
-            sort=[Sort(name="overall_spend", desc=True)],
-            limit=50
-        )
-
-        result = real_client.queries.metrics(query)
-
-        save_result(
-            output_dir,
-            "metrics_query_complex_filter",
-            query.model_dump(),
-            {"data": result.data},
-            {
-                "description": "Mobile campaigns in US, GB, CA regions",
-                "filter": "device_type = 'mobile' AND device_region IN ('US', 'GB', 'CA')",
-                "time_range": f"{start_date.date()} to {end_date.date()}"
-            },
-            subfolder="metrics"
-        )
-
-        assert result is not None
-        print(f"\n✓ Retrieved {len(result.data)} rows (complex filter)")
-
-    def test_query_builder_with_time_dimension(self, real_client, output_dir):
-        """Test QueryBuilder with time-based dimension"""
-        # Query last 7 days with daily granularity
-        end_date = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date = (end_date - timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0)
-
-        query = (
-            QueryBuilder()
-            .metrics_view(TEST_METRICS_VIEW)
-            .dimension(
-                "timestamp_day",
-                {"time_floor": {"dimension": "__time", "grain": "day"}}
-            )
-            .dimension("advertiser_name")
-            .measures(["overall_spend", "total_bids", "win_rate"])
-            .time_range({
-                "start": start_date,
-                "end": end_date
-            })
-            .sorts([
-                {"name": "timestamp_day", "desc": False},
-                {"name": "overall_spend", "desc": True}
-            ])
-            .limit(100)
-            .build()
-        )
-
-        result = real_client.queries.metrics(query)
-
         save_result(
+            write_queue,
             output_dir,
-            "query_builder_time_dimension",
-            query.model_dump(),
+            spec.name,
+            query_dict,
             {"data": result.data},
-            {
-                "description": "QueryBuilder: Time-series query with daily granularity by advertiser",
-                "time_range": f"{start_date.date()} to {end_date.date()}",
-                "note": "Built using QueryBuilder fluent API"
-            },
-            subfolder="builder"
+            metadata,
+            subfolder=spec.subfolder
         )
 
         assert result is not None
-        print(f"\n✓ Retrieved {len(result.data)} time-series rows (via QueryBuilder)")
-
-    def test_query_builder_with_complex_filter(self, real_client, output_dir):
-        """Test QueryBuilder with complex AND filter"""
-        end_date = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date = (end_date - timedelta(days=4)).replace(hour=0, minute=0, second=0, microsecond=0)
-
-        query = (
-            QueryBuilder()
-            .metrics_view(TEST_METRICS_VIEW)
-            .dimensions(["advertiser_name", "device_type", "device_region"])
-            .measures(["overall_spend", "total_bids", "impressions", "clicks", "ctr"])
-            .where({
-                "op": "and",
-                "conditions": [
-                    {"op": "eq", "field": "device_type", "value": "mobile"},
-                    {"op": "in", "field": "device_region", "values": ["US", "GB", "CA"]}
-                ]
-            })
-            .time_range({
-                "start": start_date,
-                "end": end_date
-            })
-            .sort("overall_spend", desc=True)
-            .limit(50)
-            .build()
-        )
-
-        result = real_client.queries.metrics(query)
-
-        save_result(
-            output_dir,
-            "query_builder_complex_filter",
-            query.model_dump(),
-            {"data": result.data},
-            {
-                "description": "QueryBuilder: Mobile campaigns in US, GB, CA regions",
-                "filter": "device_type = 'mobile' AND device_region IN ('US', 'GB', 'CA')",
-                "time_range": f"{start_date.date()} to {end_date.date()}",
-                "note": "Built using QueryBuilder fluent API with dict-based filters"
-            },
-            subfolder="builder"
-        )
-
-        assert result is not None
-        print(f"\n✓ Retrieved {len(result.data)} rows (complex filter via QueryBuilder)")
+        assert isinstance(result.data, list)
+        print(f"\n✓ Retrieved {len(result.data)} rows ({spec.name})")
 
 
 @pytest.mark.e2e
 class TestMetricsSqlQueryE2E:
     """E2E tests for metrics SQL queries"""
 
-    def test_basic_metrics_sql(self, real_client, output_dir):
+    def test_basic_metrics_sql(self, real_client, output_dir, write_queue):
         """Test basic metrics SQL query"""
-        from pyrill.exceptions import RillAPIError
-
-        query = MetricsSqlQuery(
-            sql="""
-            SELECT
-                advertiser_name,
-                device_type,
-                overall_spend,
-                total_bids
-            FROM bids_metrics
-            ORDER BY overall_spend DESC
-            LIMIT 20
-            """
-        )
+        query = _METRICS_SQL_QUERY
+        query_dict = _METRICS_SQL_QUERY_DICT
 
         try:
             result = real_client.queries.metrics_sql(query)
 
             save_result(
+                write_queue,
                 output_dir,
                 "basic_metrics_sql",
-                {"sql": query.sql},
+                query_dict,
                 {"data": result.data},
                 {
                     "description": "Metrics SQL query - queries pre-aggregated metrics view",
@@ -585,9 +533,10 @@ class TestMetricsSqlQueryE2E:
         except RillAPIError as e:
             # Save error details for diagnosis
             save_error(
+                write_queue,
                 output_dir,
                 "basic_metrics_sql",
-                {"sql": query.sql},
+                query_dict,
                 e,
                 {
                     "description": "Aggregated spend by advertiser and device type (FAILED)",
@@ -603,27 +552,16 @@ class TestMetricsSqlQueryE2E:
 class TestSqlQueryE2E:
     """E2E tests for raw SQL queries"""
 
-    def test_basic_sql_query(self, real_client, output_dir):
+    def test_basic_sql_query(self, real_client, output_dir, write_queue):
         """Test basic raw SQL query"""
-        query = SqlQuery(
-            sql="""
-            SELECT
-                COUNT(*) as total_rows,
-                COUNT(DISTINCT advertiser_name) as unique_advertisers,
-                COUNT(DISTINCT campaign_name) as unique_campaigns,
-                MIN(__time) as earliest_date,
-                MAX(__time) as latest_date
-            FROM bids_data_model
-            """,
-            connector="duckdb"
-        )
-
+        query = _SQL_QUERY
         result = real_client.queries.sql(query)
 
         save_result(
+            write_queue,
             output_dir,
             "basic_sql_query",
-            {"sql": query.sql, "connector": query.connector},
+            _SQL_QUERY_DICT,
             {"data": result.data},
             {
                 "description": "Dataset summary statistics"
@@ -634,4 +572,4 @@ class TestSqlQueryE2E:
         assert result is not None
         print(f"\n✓ Retrieved {len(result.data)} rows from raw SQL")
         if result.data:
-            print(f"  Dataset stats: {json.dumps(result.data[0], indent=2, default=str)}")
+            print(f"  Dataset stats: {json.dumps(coerce_row(result.data[0]), indent=2)}")
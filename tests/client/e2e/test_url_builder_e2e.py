@@ -2,15 +2,21 @@
 End-to-end tests for UrlBuilder - converts queries from test_query_e2e.py to URLs
 
 These tests take all MetricsQuery objects from test_query_e2e.py and generate URLs.
-URLs are saved to fixtures/query_results/object/urls/ for inspection and validation.
+With --write-fixtures, URLs are saved to fixtures/query_results/object/urls/ for
+inspection and validation.
 
-Run with: pytest tests/client/e2e/test_url_builder_e2e.py --run-e2e -v -s
+Run with: pytest tests/client/e2e/test_url_builder_e2e.py --run-e2e -v
+(add --log-cli-level=DEBUG to see each generated URL)
 """
 
-import os
-import json
-from datetime import datetime, timedelta, timezone
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta, timezone
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
 import pytest
 
 from pyrill import (
@@ -28,20 +34,22 @@ from pyrill import (
     DimensionCompute,
     DimensionComputeTimeFloor,
 )
+from tests.client.e2e.conftest import TEST_ORG, TEST_PROJECT, TEST_METRICS_VIEW, WriteQueue, dump_json, write_bytes_atomic
 
 
-# Test configuration (matching test_query_e2e.py)
-TEST_ORG = "demo"
-TEST_PROJECT = "rill-openrtb-prog-ads"
-TEST_METRICS_VIEW = "bids_metrics"
+pytestmark = pytest.mark.e2e
+
+log = logging.getLogger(__name__)
 
 # Output directory for URLs
 URL_OUTPUT_DIR = Path(__file__).parent.parent.parent / "fixtures" / "query_results" / "object" / "urls"
+# Subfolders the UrlCase specs below save into
+URL_SUBFOLDERS = ("metrics", "builder", "variations")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def url_builder():
-    """Create a UrlBuilder for generating URLs"""
+    """Create a UrlBuilder for generating URLs, shared by the session (it holds no per-URL state)"""
     return UrlBuilder(
         org=TEST_ORG,
         project=TEST_PROJECT
@@ -49,66 +57,95 @@ def url_builder():
 
 
 @pytest.fixture(scope="module")
-def url_output_dir():
-    """Create output directory for URL results"""
-    URL_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+def url_output_dir(request):
+    """
+    Create output directory for URL results, with every case subfolder.
+
+    Returns None unless --write-fixtures is passed; the saves are then skipped,
+    since the tests' assertions do not depend on the written files.
+
+    Safe under pytest-xdist: --dist=loadfile keeps this module on one worker,
+    every case writes its own file name, mkdir tolerates existing folders and
+    each file is replaced atomically, so there is no shared mutable state to
+    split per worker.
+    """
+    if not request.config.getoption("--write-fixtures", default=False):
+        return None
+    for subfolder in URL_SUBFOLDERS:
+        (URL_OUTPUT_DIR / subfolder).mkdir(parents=True, exist_ok=True)
     return URL_OUTPUT_DIR
 
 
-def save_url_result(output_dir: Path, test_name: str, query: MetricsQuery, url_obj, metadata: dict = None, subfolder: str = None):
-    """Save query and generated URL to JSON file"""
-    output = {
-        "test_name": test_name,
-        "org": TEST_ORG,
-        "project": TEST_PROJECT,
-        "query": query.model_dump(),
-        "url": {
-            "string": str(url_obj),
-            "components": {
-                "base_url": url_obj.base_url,
-                "org": url_obj.org,
-                "project": url_obj.project,
-                "page_type": url_obj.page_type,
-                "page_name": url_obj.page_name,
-                "time_range": url_obj.time_range,
-                "timezone": url_obj.timezone,
-                "measures": url_obj.measures,
-                "dimensions": url_obj.dimensions,
-                "sort_dir": url_obj.sort_dir,
-                "sort_by": url_obj.sort_by,
-                "leaderboard_measures": url_obj.leaderboard_measures,
-                "view": url_obj.view,
-                "rows": url_obj.rows,
-                "cols": url_obj.cols,
-                "table_mode": url_obj.table_mode,
-                "grain": url_obj.grain,
-                "compare_time_range": url_obj.compare_time_range,
-            }
-        },
-        "metadata": metadata or {}
-    }
+def _write_output(filepath: Path, output: Any) -> None:
+    """Write output as indented JSON, the layout of the checked-in URL fixtures"""
+    write_bytes_atomic(filepath, dump_json(output))
+
 
-    # Create subfolder path if specified
-    if subfolder:
-        target_dir = output_dir / subfolder
-        target_dir.mkdir(parents=True, exist_ok=True)
-    else:
-        target_dir = output_dir
+# RillUrl fields saved as the URL's "components", in file order
+_URL_FIELDS = (
+    "base_url", "org", "project", "page_type", "page_name", "time_range", "timezone",
+    "measures", "dimensions", "sort_dir", "sort_by", "leaderboard_measures",
+    "view", "rows", "cols", "table_mode", "grain", "compare_time_range",
+)
+_get_url_fields = attrgetter(*_URL_FIELDS)
+
+
+@dataclass(frozen=True)
+class SavedUrl:
+    """A generated URL as saved: its string form and its RillUrl fields"""
+    string: str
+    components: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class UrlResult:
+    """The file saved for one generated URL; dump_json encodes its fields in order"""
+    test_name: str
+    org: str
+    project: str
+    query: MetricsQuery
+    url: SavedUrl
+    metadata: Dict[str, Any]
+
+
+def save_url_result(write_queue: WriteQueue, output_dir: Path, test_name: str, query: MetricsQuery, url_obj, metadata: dict = None,
+                    subfolder: str = None, url_str: Optional[str] = None):
+    """Save query and generated URL to JSON file (pass url_str when str(url_obj) is already at hand)"""
+    if output_dir is None:
+        return None
+    if url_str is None:
+        url_str = str(url_obj)
+    # Everything here is JSON-native (RillUrl fields are all str/list[str])
+    # except the query model, which dump_json serializes through pydantic in
+    # JSON mode, so no pre-conversion pass or str() fallback is needed
+    output = UrlResult(
+        test_name=test_name,
+        org=TEST_ORG,
+        project=TEST_PROJECT,
+        query=query,
+        url=SavedUrl(
+            string=url_str,
+            components=dict(zip(_URL_FIELDS, _get_url_fields(url_obj))),
+        ),
+        metadata=metadata or {},
+    )
+
+    # Subfolders are created up front by the url_output_dir fixture
+    target_dir = output_dir / subfolder if subfolder else output_dir
 
     filename = f"{test_name}.json"
     filepath = target_dir / filename
 
-    with open(filepath, "w") as f:
-        json.dump(output, f, indent=2, default=str)
+    write_queue.submit(_write_output, filepath, output)
 
-    print(f"\n✓ Saved URL to: {filepath}")
-    print(f"  - URL: {str(url_obj)}")
-    print(f"  - Length: {len(str(url_obj))} characters")
+    log.debug("Queued URL for %s (%d characters): %s", filepath, len(url_str), url_str)
     return filepath
 
 
-def save_url_error(output_dir: Path, test_name: str, query: MetricsQuery, error: Exception, metadata: dict = None, subfolder: str = None):
+def save_url_error(write_queue: WriteQueue, output_dir: Path, test_name: str, query: MetricsQuery, error: Exception, metadata: dict = None, subfolder: str = None):
     """Save query and URL generation error to JSON file"""
+    if output_dir is None:
+        return None
     error_data = {
         "error_type": type(error).__name__,
         "error_message": str(error),
@@ -118,638 +155,568 @@ def save_url_error(output_dir: Path, test_name: str, query: MetricsQuery, error:
         "test_name": test_name,
         "org": TEST_ORG,
         "project": TEST_PROJECT,
-        "query": query.model_dump() if isinstance(query, MetricsQuery) else query,
+        "query": query,
         "error": error_data,
         "metadata": metadata or {},
         "success": False
     }
 
-    # Create subfolder path if specified
-    if subfolder:
-        target_dir = output_dir / subfolder
-        target_dir.mkdir(parents=True, exist_ok=True)
-    else:
-        target_dir = output_dir
+    # Subfolders are created up front by the url_output_dir fixture
+    target_dir = output_dir / subfolder if subfolder else output_dir
 
     filename = f"{test_name}_ERROR.json"
     filepath = target_dir / filename
 
-    with open(filepath, "w") as f:
-        json.dump(output, f, indent=2, default=str)
+    write_queue.submit(_write_output, filepath, output)
 
-    print(f"\n✗ Saved URL generation error to: {filepath}")
-    print(f"  - Error type: {error_data['error_type']}")
-    print(f"  - Message: {error_data['error_message']}")
+    log.debug("Queued URL generation error for %s: %s: %s",
+              filepath, error_data["error_type"], error_data["error_message"])
     return filepath
 
 
-@pytest.mark.e2e
-class TestMetricsQueryUrlGeneration:
-    """Generate URLs for all MetricsQuery tests from test_query_e2e.py"""
-
-    def test_basic_metrics_query_url(self, url_builder, url_output_dir):
-        """Generate URL for basic metrics query with dimensions and measures"""
-        # Query last 3 days of data (matching test_query_e2e.py)
-        end_date = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date = (end_date - timedelta(days=3)).replace(hour=0, minute=0, second=0, microsecond=0)
-
-        query = MetricsQuery(
-            metrics_view=TEST_METRICS_VIEW,
-            dimensions=[
-                Dimension(name="advertiser_name"),
-                Dimension(name="device_type")
-            ],
-            measures=[
-                Measure(name="overall_spend"),
-                Measure(name="total_bids"),
-                Measure(name="impressions"),
-                Measure(name="win_rate")
-            ],
-            time_range=TimeRange(
-                start=start_date.isoformat(),
-                end=end_date.isoformat()
-            ),
-            sort=[Sort(name="overall_spend", desc=True)],
-            limit=20
-        )
+@pytest.fixture(scope="session")
+def frozen_now() -> datetime:
+    """
+    End of every absolute query window: midnight UTC two days ago.
+
+    Captured once per session, so all cases share one "now" and re-runs within
+    a day produce the same saved queries.
+    """
+    end_date = datetime.now(timezone.utc) - timedelta(days=2)
+    return datetime.combine(end_date.date(), time.min, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="session")
+def time_window(frozen_now) -> Callable[[int], Tuple[datetime, datetime]]:
+    """Return a `days -> (start, end)` function for windows ending at frozen_now"""
+    def window(days: int) -> Tuple[datetime, datetime]:
+        return frozen_now - timedelta(days=days), frozen_now
+    return window
+
+
+@pytest.fixture(scope="session")
+def iso_window(time_window) -> Callable[[int], Dict[str, str]]:
+    """
+    Return a `days -> {"start": ..., "end": ...}` function of ISO strings for
+    TimeRange(**...), formatted once per distinct `days`.
+
+    The returned dicts are shared, so callers must not mutate them.
+    """
+    @lru_cache(maxsize=None)
+    def window(days: int) -> Dict[str, str]:
+        start_date, end_date = time_window(days)
+        return {"start": start_date.isoformat(), "end": end_date.isoformat()}
+    return window
+
+
+def _window_note(query: MetricsQuery) -> Dict[str, str]:
+    """Metadata describing an absolute query time range as 'YYYY-MM-DD to YYYY-MM-DD' (empty otherwise)"""
+    time_range = query.time_range
+    if time_range is None or time_range.start is None:
+        return {}
+    return {"time_range": f"{str(time_range.start)[:10]} to {str(time_range.end)[:10]}"}
+
+
+# Query fixtures for the cases below (matching test_query_e2e.py). Cases name
+# them and the test resolves the name with request.getfixturevalue, so no
+# MetricsQuery is built (or validated) during collection, only when its test runs.
+# They deliberately use the validating constructors rather than model_construct:
+# UrlBuilder should see queries exactly as users build them.
+
+@pytest.fixture
+def q_basic_metrics(iso_window) -> MetricsQuery:
+    # Last 3 days of data
+    return MetricsQuery(
+        metrics_view=TEST_METRICS_VIEW,
+        dimensions=[
+            Dimension(name="advertiser_name"),
+            Dimension(name="device_type")
+        ],
+        measures=[
+            Measure(name="overall_spend"),
+            Measure(name="total_bids"),
+            Measure(name="impressions"),
+            Measure(name="win_rate")
+        ],
+        time_range=TimeRange(**iso_window(3)),
+        sort=[Sort(name="overall_spend", desc=True)],
+        limit=20
+    )
 
-        url = url_builder.build_url(query)
-
-        # Save URL result
-        save_url_result(
-            url_output_dir,
-            "basic_metrics_query",
-            query,
-            url,
-            {
-                "description": "Basic metrics query with advertiser and device dimensions",
-                "time_range": f"{start_date.date()} to {end_date.date()}",
-                "expected_params": ["tr", "measures", "dims", "sort_dir", "sort_by"]
-            },
-            subfolder="metrics"
-        )
 
-        assert str(url) is not None
-        assert "bids_explore" in str(url)  # page_name in URL, not metrics_view
-        assert "advertiser_name" in str(url)
-
-    def test_metrics_query_with_time_dimension_url(self, url_builder, url_output_dir):
-        """Generate URL for metrics query with time-based dimension"""
-        # Query last 7 days with daily granularity
-        end_date = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date = (end_date - timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0)
-
-        query = MetricsQuery(
-            metrics_view=TEST_METRICS_VIEW,
-            dimensions=[
-                Dimension(
-                    name="timestamp_day",
-                    compute=DimensionCompute(
-                        time_floor=DimensionComputeTimeFloor(
-                            dimension="__time",
-                            grain=TimeGrain.DAY
-                        )
+@pytest.fixture
+def q_time_dimension(iso_window) -> MetricsQuery:
+    # Last 7 days with daily granularity
+    return MetricsQuery(
+        metrics_view=TEST_METRICS_VIEW,
+        dimensions=[
+            Dimension(
+                name="timestamp_day",
+                compute=DimensionCompute(
+                    time_floor=DimensionComputeTimeFloor(
+                        dimension="__time",
+                        grain=TimeGrain.DAY
                     )
-                ),
-                Dimension(name="advertiser_name")
-            ],
-            measures=[
-                Measure(name="overall_spend"),
-                Measure(name="total_bids"),
-                Measure(name="win_rate")
-            ],
-            time_range=TimeRange(
-                start=start_date.isoformat(),
-                end=end_date.isoformat()
-            ),
-            sort=[
-                Sort(name="timestamp_day", desc=False),
-                Sort(name="overall_spend", desc=True)
-            ],
-            limit=100
-        )
-
-        url = url_builder.build_url(query)
-
-        save_url_result(
-            url_output_dir,
-            "metrics_query_time_dimension",
-            query,
-            url,
-            {
-                "description": "Time-series query with daily granularity by advertiser",
-                "time_range": f"{start_date.date()} to {end_date.date()}",
-                "note": "Computed dimension with time_floor - dimension name used in URL"
-            },
-            subfolder="metrics"
-        )
-
-        assert str(url) is not None
-        print(f"\n✓ Generated URL for time-series query")
-
-    def test_metrics_query_with_filter_url(self, url_builder, url_output_dir):
-        """Generate URL for metrics query with WHERE filter"""
-        end_date = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date = (end_date - timedelta(days=5)).replace(hour=0, minute=0, second=0, microsecond=0)
-
-        query = MetricsQuery(
-            metrics_view=TEST_METRICS_VIEW,
-            dimensions=[
-                Dimension(name="advertiser_name"),
-                Dimension(name="campaign_name")
-            ],
-            measures=[
-                Measure(name="overall_spend"),
-                Measure(name="total_bids"),
-                Measure(name="clicks"),
-                Measure(name="ctr")
-            ],
-            where=Expression(
-                cond=Condition(
-                    op=Operator.EQ,
-                    exprs=[
-                        Expression(name="device_type"),
-                        Expression(val="mobile")
-                    ]
                 )
             ),
-            time_range=TimeRange(
-                start=start_date.isoformat(),
-                end=end_date.isoformat()
-            ),
-            sort=[Sort(name="overall_spend", desc=True)],
-            limit=30
-        )
+            Dimension(name="advertiser_name")
+        ],
+        measures=[
+            Measure(name="overall_spend"),
+            Measure(name="total_bids"),
+            Measure(name="win_rate")
+        ],
+        time_range=TimeRange(**iso_window(7)),
+        sort=[
+            Sort(name="timestamp_day", desc=False),
+            Sort(name="overall_spend", desc=True)
+        ],
+        limit=100
+    )
 
-        url = url_builder.build_url(query)
-
-        save_url_result(
-            url_output_dir,
-            "metrics_query_with_filter",
-            query,
-            url,
-            {
-                "description": "Mobile device campaigns sorted by spend",
-                "filter": "device_type = 'mobile'",
-                "time_range": f"{start_date.date()} to {end_date.date()}",
-                "warning": "WHERE clause cannot be encoded in URL - URL generated without filter"
-            },
-            subfolder="metrics"
-        )
 
-        assert str(url) is not None
-        # Note: filter won't be in URL (unsupported feature)
-        print(f"\n✓ Generated URL for query with filter (filter not in URL - expected)")
-
-    def test_metrics_query_with_iso_duration_time_range_url(self, url_builder, url_output_dir):
-        """Generate URL for metrics query with ISO 8601 duration"""
-        query = MetricsQuery(
-            metrics_view=TEST_METRICS_VIEW,
-            dimensions=[
-                Dimension(name="advertiser_name"),
-                Dimension(name="device_type"),
-                Dimension(name="creative_type")
-            ],
-            measures=[
-                Measure(name="overall_spend"),
-                Measure(name="impressions"),
-                Measure(name="video_completes"),
-                Measure(name="video_completion_rate")
-            ],
-            time_range=TimeRange(iso_duration="P7D"),
-            sort=[Sort(name="video_completes", desc=True)],
-            limit=25
-        )
+@pytest.fixture
+def q_with_filter(iso_window) -> MetricsQuery:
+    return MetricsQuery(
+        metrics_view=TEST_METRICS_VIEW,
+        dimensions=[
+            Dimension(name="advertiser_name"),
+            Dimension(name="campaign_name")
+        ],
+        measures=[
+            Measure(name="overall_spend"),
+            Measure(name="total_bids"),
+            Measure(name="clicks"),
+            Measure(name="ctr")
+        ],
+        where=Expression(
+            cond=Condition(
+                op=Operator.EQ,
+                exprs=[
+                    Expression(name="device_type"),
+                    Expression(val="mobile")
+                ]
+            )
+        ),
+        time_range=TimeRange(**iso_window(5)),
+        sort=[Sort(name="overall_spend", desc=True)],
+        limit=30
+    )
 
-        url = url_builder.build_url(query)
-
-        save_url_result(
-            url_output_dir,
-            "metrics_query_iso_duration_time_range",
-            query,
-            url,
-            {
-                "description": "Video performance metrics over last 7 days using iso_duration",
-                "time_range": "iso_duration='P7D'",
-                "expected_tr_param": "P7D"
-            },
-            subfolder="metrics"
-        )
 
-        assert str(url) is not None
-        assert "tr=P7D" in str(url)
-        print(f"\n✓ Generated URL with iso_duration time range")
-
-    def test_metrics_query_with_expression_time_range_url(self, url_builder, url_output_dir):
-        """Generate URL for metrics query with expression time range"""
-        query = MetricsQuery(
-            metrics_view=TEST_METRICS_VIEW,
-            dimensions=[
-                Dimension(name="advertiser_name"),
-                Dimension(name="device_type"),
-                Dimension(name="creative_type")
-            ],
-            measures=[
-                Measure(name="overall_spend"),
-                Measure(name="impressions"),
-                Measure(name="video_completes"),
-                Measure(name="video_completion_rate")
-            ],
-            time_range=TimeRange(expression="P7D"),
-            sort=[Sort(name="video_completes", desc=True)],
-            limit=25
-        )
+def _video_query(time_range: TimeRange) -> MetricsQuery:
+    """Video performance query shared by the iso_duration and expression time range cases"""
+    return MetricsQuery(
+        metrics_view=TEST_METRICS_VIEW,
+        dimensions=[
+            Dimension(name="advertiser_name"),
+            Dimension(name="device_type"),
+            Dimension(name="creative_type")
+        ],
+        measures=[
+            Measure(name="overall_spend"),
+            Measure(name="impressions"),
+            Measure(name="video_completes"),
+            Measure(name="video_completion_rate")
+        ],
+        time_range=time_range,
+        sort=[Sort(name="video_completes", desc=True)],
+        limit=25
+    )
 
-        url = url_builder.build_url(query)
-
-        save_url_result(
-            url_output_dir,
-            "metrics_query_expression_time_range",
-            query,
-            url,
-            {
-                "description": "Video performance metrics using expression parameter",
-                "time_range": "expression='P7D'",
-                "note": "Expression passed through as-is to tr parameter"
-            },
-            subfolder="metrics"
-        )
 
-        assert str(url) is not None
-        assert "tr=P7D" in str(url)
-        print(f"\n✓ Generated URL with expression time range")
-
-    def test_metrics_query_complex_filter_url(self, url_builder, url_output_dir):
-        """Generate URL for metrics query with complex AND filter"""
-        end_date = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date = (end_date - timedelta(days=4)).replace(hour=0, minute=0, second=0, microsecond=0)
-
-        query = MetricsQuery(
-            metrics_view=TEST_METRICS_VIEW,
-            dimensions=[
-                Dimension(name="advertiser_name"),
-                Dimension(name="device_type"),
-                Dimension(name="device_region")
-            ],
-            measures=[
-                Measure(name="overall_spend"),
-                Measure(name="total_bids"),
-                Measure(name="impressions"),
-                Measure(name="clicks"),
-                Measure(name="ctr")
-            ],
-            where=Expression(
-                cond=Condition(
-                    op=Operator.AND,
-                    exprs=[
-                        Expression(
-                            cond=Condition(
-                                op=Operator.EQ,
-                                exprs=[
-                                    Expression(name="device_type"),
-                                    Expression(val="mobile")
-                                ]
-                            )
-                        ),
-                        Expression(
-                            cond=Condition(
-                                op=Operator.IN,
-                                exprs=[
-                                    Expression(name="device_region"),
-                                    Expression(val=["US", "GB", "CA"])
-                                ]
-                            )
+@pytest.fixture
+def q_video_iso_duration() -> MetricsQuery:
+    return _video_query(TimeRange(iso_duration="P7D"))
+
+
+@pytest.fixture
+def q_video_expression() -> MetricsQuery:
+    return _video_query(TimeRange(expression="P7D"))
+
+
+@pytest.fixture
+def q_complex_filter(iso_window) -> MetricsQuery:
+    return MetricsQuery(
+        metrics_view=TEST_METRICS_VIEW,
+        dimensions=[
+            Dimension(name="advertiser_name"),
+            Dimension(name="device_type"),
+            Dimension(name="device_region")
+        ],
+        measures=[
+            Measure(name="overall_spend"),
+            Measure(name="total_bids"),
+            Measure(name="impressions"),
+            Measure(name="clicks"),
+            Measure(name="ctr")
+        ],
+        where=Expression(
+            cond=Condition(
+                op=Operator.AND,
+                exprs=[
+                    Expression(
+                        cond=Condition(
+                            op=Operator.EQ,
+                            exprs=[
+                                Expression(name="device_type"),
+                                Expression(val="mobile")
+                            ]
                         )
-                    ]
-                )
-            ),
-            time_range=TimeRange(
-                start=start_date.isoformat(),
-                end=end_date.isoformat()
-            ),
-            sort=[Sort(name="overall_spend", desc=True)],
-            limit=50
-        )
-
-        url = url_builder.build_url(query)
-
-        save_url_result(
-            url_output_dir,
-            "metrics_query_complex_filter",
-            query,
-            url,
-            {
-                "description": "Mobile campaigns in US, GB, CA regions",
-                "filter": "device_type = 'mobile' AND device_region IN ('US', 'GB', 'CA')",
-                "time_range": f"{start_date.date()} to {end_date.date()}",
-                "warning": "Complex WHERE clause cannot be encoded in URL"
-            },
-            subfolder="metrics"
-        )
-
-        assert str(url) is not None
-        print(f"\n✓ Generated URL for complex filter query (filter not in URL)")
-
-    def test_query_builder_with_time_dimension_url(self, url_builder, url_output_dir):
-        """Generate URL for QueryBuilder with time-based dimension"""
-        # Query last 7 days with daily granularity
-        end_date = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date = (end_date - timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0)
-
-        query = (
-            QueryBuilder()
-            .metrics_view(TEST_METRICS_VIEW)
-            .dimension(
-                "timestamp_day",
-                {"time_floor": {"dimension": "__time", "grain": "day"}}
+                    ),
+                    Expression(
+                        cond=Condition(
+                            op=Operator.IN,
+                            exprs=[
+                                Expression(name="device_region"),
+                                Expression(val=["US", "GB", "CA"])
+                            ]
+                        )
+                    )
+                ]
             )
-            .dimension("advertiser_name")
-            .measures(["overall_spend", "total_bids", "win_rate"])
-            .time_range({
-                "start": start_date,
-                "end": end_date
-            })
-            .sorts([
-                {"name": "timestamp_day", "desc": False},
-                {"name": "overall_spend", "desc": True}
-            ])
-            .limit(100)
-            .build()
-        )
+        ),
+        time_range=TimeRange(**iso_window(4)),
+        sort=[Sort(name="overall_spend", desc=True)],
+        limit=50
+    )
 
-        url = url_builder.build_url(query)
-
-        save_url_result(
-            url_output_dir,
-            "query_builder_time_dimension",
-            query,
-            url,
-            {
-                "description": "QueryBuilder: Time-series query with daily granularity by advertiser",
-                "time_range": f"{start_date.date()} to {end_date.date()}",
-                "note": "Built using QueryBuilder fluent API"
-            },
-            subfolder="builder"
-        )
 
-        assert str(url) is not None
-        print(f"\n✓ Generated URL for QueryBuilder time-series query")
-
-    def test_query_builder_with_complex_filter_url(self, url_builder, url_output_dir):
-        """Generate URL for QueryBuilder with complex AND filter"""
-        end_date = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date = (end_date - timedelta(days=4)).replace(hour=0, minute=0, second=0, microsecond=0)
-
-        query = (
-            QueryBuilder()
-            .metrics_view(TEST_METRICS_VIEW)
-            .dimensions(["advertiser_name", "device_type", "device_region"])
-            .measures(["overall_spend", "total_bids", "impressions", "clicks", "ctr"])
-            .where({
-                "op": "and",
-                "conditions": [
-                    {"op": "eq", "field": "device_type", "value": "mobile"},
-                    {"op": "in", "field": "device_region", "values": ["US", "GB", "CA"]}
-                ]
-            })
-            .time_range({
-                "start": start_date,
-                "end": end_date
-            })
-            .sort("overall_spend", desc=True)
-            .limit(50)
-            .build()
+@pytest.fixture
+def q_builder_time_dimension(time_window) -> MetricsQuery:
+    # Last 7 days with daily granularity, via the fluent API
+    start_date, end_date = time_window(7)
+    return (
+        QueryBuilder()
+        .metrics_view(TEST_METRICS_VIEW)
+        .dimension(
+            "timestamp_day",
+            {"time_floor": {"dimension": "__time", "grain": "day"}}
         )
+        .dimension("advertiser_name")
+        .measures(["overall_spend", "total_bids", "win_rate"])
+        .time_range({
+            "start": start_date,
+            "end": end_date
+        })
+        .sorts([
+            {"name": "timestamp_day", "desc": False},
+            {"name": "overall_spend", "desc": True}
+        ])
+        .limit(100)
+        .build()
+    )
 
-        url = url_builder.build_url(query)
-
-        save_url_result(
-            url_output_dir,
-            "query_builder_complex_filter",
-            query,
-            url,
-            {
-                "description": "QueryBuilder: Mobile campaigns in US, GB, CA regions",
-                "filter": "device_type = 'mobile' AND device_region IN ('US', 'GB', 'CA')",
-                "time_range": f"{start_date.date()} to {end_date.date()}",
-                "note": "Built using QueryBuilder fluent API with dict-based filters",
-                "warning": "WHERE clause not encoded in URL"
-            },
-            subfolder="builder"
-        )
 
-        assert str(url) is not None
-        print(f"\n✓ Generated URL for QueryBuilder complex filter query")
+@pytest.fixture
+def q_builder_complex_filter(time_window) -> MetricsQuery:
+    start_date, end_date = time_window(4)
+    return (
+        QueryBuilder()
+        .metrics_view(TEST_METRICS_VIEW)
+        .dimensions(["advertiser_name", "device_type", "device_region"])
+        .measures(["overall_spend", "total_bids", "impressions", "clicks", "ctr"])
+        .where({
+            "op": "and",
+            "conditions": [
+                {"op": "eq", "field": "device_type", "value": "mobile"},
+                {"op": "in", "field": "device_region", "values": ["US", "GB", "CA"]}
+            ]
+        })
+        .time_range({
+            "start": start_date,
+            "end": end_date
+        })
+        .sort("overall_spend", desc=True)
+        .limit(50)
+        .build()
+    )
 
 
-@pytest.mark.e2e
-class TestUrlBuilderVariations:
-    """Test UrlBuilder with different parameter variations"""
-
-    def test_url_with_pivot_mode(self, url_builder, url_output_dir):
-        """Generate pivot mode URL"""
-        end_date = (datetime.now(timezone.utc) - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date = (end_date - timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0)
-
-        query = MetricsQuery(
-            metrics_view=TEST_METRICS_VIEW,
-            dimensions=[
-                Dimension(
-                    name="timestamp_day",
-                    compute=DimensionCompute(
-                        time_floor=DimensionComputeTimeFloor(
-                            dimension="__time",
-                            grain=TimeGrain.DAY
-                        )
+@pytest.fixture(scope="module")
+def q_timeseries(iso_window) -> MetricsQuery:
+    # Last 7 days by day and advertiser, for the pivot comparison
+    return MetricsQuery(
+        metrics_view=TEST_METRICS_VIEW,
+        dimensions=[
+            Dimension(
+                name="timestamp_day",
+                compute=DimensionCompute(
+                    time_floor=DimensionComputeTimeFloor(
+                        dimension="__time",
+                        grain=TimeGrain.DAY
                     )
-                ),
-                Dimension(name="advertiser_name")
-            ],
-            measures=[
-                Measure(name="overall_spend"),
-                Measure(name="total_bids"),
-                Measure(name="impressions")
-            ],
-            time_range=TimeRange(
-                start=start_date.isoformat(),
-                end=end_date.isoformat()
+                )
             ),
-            sort=[Sort(name="timestamp_day", desc=False)]
-        )
+            Dimension(name="advertiser_name")
+        ],
+        measures=[
+            Measure(name="overall_spend"),
+            Measure(name="total_bids"),
+            Measure(name="impressions")
+        ],
+        time_range=TimeRange(**iso_window(7)),
+        sort=[Sort(name="timestamp_day", desc=False)]
+    )
 
-        # Generate standard URL
-        standard_url = url_builder.build_url(query)
-
-        # Generate pivot URL
-        pivot_url = url_builder.build_url(query, pivot=True)
-
-        # Save both for comparison
-        save_url_result(
-            url_output_dir,
-            "url_pivot_mode_standard",
-            query,
-            standard_url,
-            {
-                "description": "Standard explore view (for comparison with pivot)",
-                "time_range": f"{start_date.date()} to {end_date.date()}"
-            },
-            subfolder="variations"
-        )
 
-        save_url_result(
-            url_output_dir,
-            "url_pivot_mode_pivot",
-            query,
-            pivot_url,
-            {
-                "description": "Pivot table view of same query",
-                "time_range": f"{start_date.date()} to {end_date.date()}",
-                "note": "Uses view=pivot, rows=dimensions, cols=measures, table_mode=nest"
-            },
-            subfolder="variations"
-        )
+@pytest.fixture(scope="module")
+def q_leaderboard() -> MetricsQuery:
+    return MetricsQuery(
+        metrics_view=TEST_METRICS_VIEW,
+        dimensions=[
+            Dimension(name="advertiser_name"),
+            Dimension(name="campaign_name")
+        ],
+        measures=[
+            Measure(name="overall_spend"),
+            Measure(name="total_bids"),
+            Measure(name="impressions"),
+            Measure(name="clicks"),
+            Measure(name="ctr")
+        ],
+        time_range=TimeRange(iso_duration="P7D"),
+        sort=[Sort(name="overall_spend", desc=True)]
+    )
 
-        assert "view=pivot" in str(pivot_url)
-        assert "view=pivot" not in str(standard_url)
-        print(f"\n✓ Generated both standard and pivot URLs")
-
-    def test_url_with_leaderboard_variations(self, url_builder, url_output_dir):
-        """Generate URLs with different leaderboard measure configurations"""
-        query = MetricsQuery(
-            metrics_view=TEST_METRICS_VIEW,
-            dimensions=[
-                Dimension(name="advertiser_name"),
-                Dimension(name="campaign_name")
-            ],
-            measures=[
-                Measure(name="overall_spend"),
-                Measure(name="total_bids"),
-                Measure(name="impressions"),
-                Measure(name="clicks"),
-                Measure(name="ctr")
-            ],
-            time_range=TimeRange(iso_duration="P7D"),
-            sort=[Sort(name="overall_spend", desc=True)]
-        )
 
-        # Generate with all measures in leaderboard
-        url_multi = url_builder.build_url(query, multi_leaderboard_measures=True)
-
-        # Generate with only first measure in leaderboard
-        url_single = url_builder.build_url(query, multi_leaderboard_measures=False)
-
-        save_url_result(
-            url_output_dir,
-            "url_leaderboard_multi",
-            query,
-            url_multi,
-            {
-                "description": "All measures in leaderboard",
-                "leaderboard_config": "multi_leaderboard_measures=True",
-                "expected_leaderboard": "overall_spend,total_bids,impressions,clicks,ctr"
-            },
-            subfolder="variations"
-        )
+@pytest.fixture(scope="module")
+def q_comparison() -> MetricsQuery:
+    return MetricsQuery(
+        metrics_view=TEST_METRICS_VIEW,
+        dimensions=[
+            Dimension(name="advertiser_name")
+        ],
+        measures=[
+            Measure(name="overall_spend"),
+            Measure(name="total_bids")
+        ],
+        time_range=TimeRange(iso_duration="P7D"),
+        sort=[Sort(name="overall_spend", desc=True)]
+    )
 
-        save_url_result(
-            url_output_dir,
-            "url_leaderboard_single",
-            query,
-            url_single,
-            {
-                "description": "Only first measure in leaderboard",
-                "leaderboard_config": "multi_leaderboard_measures=False",
-                "expected_leaderboard": "overall_spend"
-            },
-            subfolder="variations"
-        )
 
-        assert "leaderboard_measures=" in str(url_multi)
-        assert "leaderboard_measures=" in str(url_single)
-        print(f"\n✓ Generated URLs with different leaderboard configurations")
-
-    def test_url_with_comparison(self, url_builder, url_output_dir):
-        """Generate URL with comparison enabled"""
-        query = MetricsQuery(
-            metrics_view=TEST_METRICS_VIEW,
-            dimensions=[
-                Dimension(name="advertiser_name")
-            ],
-            measures=[
-                Measure(name="overall_spend"),
-                Measure(name="total_bids")
-            ],
-            time_range=TimeRange(iso_duration="P7D"),
-            sort=[Sort(name="overall_spend", desc=True)]
-        )
+@pytest.fixture
+def q_timezone(tz: str) -> MetricsQuery:
+    # `tz` is the timezone test's parameter
+    return MetricsQuery(
+        metrics_view=TEST_METRICS_VIEW,
+        dimensions=[Dimension(name="advertiser_name")],
+        measures=[Measure(name="overall_spend")],
+        time_range=TimeRange(iso_duration="P7D"),
+        time_zone=tz,
+        sort=[Sort(name="overall_spend", desc=True)]
+    )
 
-        # Without comparison
-        url_no_compare = url_builder.build_url(query, enable_comparison=False)
-
-        # With comparison
-        url_with_compare = url_builder.build_url(query, enable_comparison=True)
-
-        save_url_result(
-            url_output_dir,
-            "url_comparison_disabled",
-            query,
-            url_no_compare,
-            {
-                "description": "URL without comparison",
-                "comparison_config": "enable_comparison=False"
-            },
-            subfolder="variations"
-        )
 
-        save_url_result(
-            url_output_dir,
-            "url_comparison_enabled",
-            query,
-            url_with_compare,
-            {
-                "description": "URL with prior period comparison",
-                "comparison_config": "enable_comparison=True",
-                "expected_param": "compare_tr=rill-PP"
-            },
-            subfolder="variations"
-        )
+@dataclass(frozen=True)
+class UrlCase:
+    """
+    A URL generation case: the query to build, the build_url() options to use,
+    and how to label and check the generated URL.
+    """
+    name: str
+    query: str  # name of the q_* fixture that builds the query
+    description: str
+    subfolder: str = "metrics"
+    build_kwargs: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    expected: Tuple[str, ...] = ()    # substrings the URL must contain
+    unexpected: Tuple[str, ...] = ()  # substrings the URL must not contain
+
+
+_FILTER_WARNING = "WHERE clause cannot be encoded in URL - URL generated without filter"
+_MOBILE_IN_REGIONS = "device_type = 'mobile' AND device_region IN ('US', 'GB', 'CA')"
+
+# One case per MetricsQuery test in test_query_e2e.py
+QUERY_URL_CASES: List[UrlCase] = [
+    UrlCase(
+        "basic_metrics_query",
+        "q_basic_metrics",
+        "Basic metrics query with advertiser and device dimensions",
+        metadata={"expected_params": ["tr", "measures", "dims", "sort_dir", "sort_by"]},
+        expected=("bids_explore", "advertiser_name"),  # page_name in URL, not metrics_view
+    ),
+    UrlCase(
+        "metrics_query_time_dimension",
+        "q_time_dimension",
+        "Time-series query with daily granularity by advertiser",
+        metadata={"note": "Computed dimension with time_floor - dimension name used in URL"},
+    ),
+    UrlCase(
+        "metrics_query_with_filter",
+        "q_with_filter",
+        "Mobile device campaigns sorted by spend",
+        metadata={"filter": "device_type = 'mobile'", "warning": _FILTER_WARNING},
+    ),
+    UrlCase(
+        "metrics_query_iso_duration_time_range",
+        "q_video_iso_duration",
+        "Video performance metrics over last 7 days using iso_duration",
+        metadata={"time_range": "iso_duration='P7D'", "expected_tr_param": "P7D"},
+        expected=("tr=P7D",),
+    ),
+    UrlCase(
+        "metrics_query_expression_time_range",
+        "q_video_expression",
+        "Video performance metrics using expression parameter",
+        metadata={"time_range": "expression='P7D'", "note": "Expression passed through as-is to tr parameter"},
+        expected=("tr=P7D",),
+    ),
+    UrlCase(
+        "metrics_query_complex_filter",
+        "q_complex_filter",
+        "Mobile campaigns in US, GB, CA regions",
+        metadata={"filter": _MOBILE_IN_REGIONS, "warning": "Complex WHERE clause cannot be encoded in URL"},
+    ),
+    UrlCase(
+        "query_builder_time_dimension",
+        "q_builder_time_dimension",
+        "QueryBuilder: Time-series query with daily granularity by advertiser",
+        subfolder="builder",
+        metadata={"note": "Built using QueryBuilder fluent API"},
+    ),
+    UrlCase(
+        "query_builder_complex_filter",
+        "q_builder_complex_filter",
+        "QueryBuilder: Mobile campaigns in US, GB, CA regions",
+        subfolder="builder",
+        metadata={
+            "filter": _MOBILE_IN_REGIONS,
+            "note": "Built using QueryBuilder fluent API with dict-based filters",
+            "warning": "WHERE clause not encoded in URL",
+        },
+    ),
+]
+
+# Pairs of URLs for one query, differing only in build_url() options. The
+# shared query fixtures are module-scoped, so each pair builds its query once.
+VARIATION_URL_CASES: List[UrlCase] = [
+    UrlCase(
+        "url_pivot_mode_standard",
+        "q_timeseries",
+        "Standard explore view (for comparison with pivot)",
+        subfolder="variations",
+        unexpected=("view=pivot",),
+    ),
+    UrlCase(
+        "url_pivot_mode_pivot",
+        "q_timeseries",
+        "Pivot table view of same query",
+        subfolder="variations",
+        build_kwargs={"pivot": True},
+        metadata={"note": "Uses view=pivot, rows=dimensions, cols=measures, table_mode=nest"},
+        expected=("view=pivot",),
+    ),
+    UrlCase(
+        "url_leaderboard_multi",
+        "q_leaderboard",
+        "All measures in leaderboard",
+        subfolder="variations",
+        build_kwargs={"multi_leaderboard_measures": True},
+        metadata={
+            "leaderboard_config": "multi_leaderboard_measures=True",
+            "expected_leaderboard": "overall_spend,total_bids,impressions,clicks,ctr",
+        },
+        expected=("leaderboard_measures=",),
+    ),
+    UrlCase(
+        "url_leaderboard_single",
+        "q_leaderboard",
+        "Only first measure in leaderboard",
+        subfolder="variations",
+        build_kwargs={"multi_leaderboard_measures": False},
+        metadata={
+            "leaderboard_config": "multi_leaderboard_measures=False",
+            "expected_leaderboard": "overall_spend",
+        },
+        expected=("leaderboard_measures=",),
+    ),
+    UrlCase(
+        "url_comparison_disabled",
+        "q_comparison",
+        "URL without comparison",
+        subfolder="variations",
+        build_kwargs={"enable_comparison": False},
+        metadata={"comparison_config": "enable_comparison=False"},
+        unexpected=("compare_tr",),
+    ),
+    UrlCase(
+        "url_comparison_enabled",
+        "q_comparison",
+        "URL with prior period comparison",
+        subfolder="variations",
+        build_kwargs={"enable_comparison": True},
+        metadata={"comparison_config": "enable_comparison=True", "expected_param": "compare_tr=rill-PP"},
+        expected=("compare_tr=rill-PP",),
+    ),
+]
+
+TIMEZONES = [
+    ("America/New_York", "Eastern Time"),
+    ("Europe/London", "British Time"),
+    ("Asia/Tokyo", "Japan Time"),
+    ("UTC", "Coordinated Universal Time"),
+]
+
+
+def _check_url_case(request, url_builder, url_output_dir, write_queue, case: UrlCase):
+    """Build the case's URL, save it, and check the expected substrings"""
+    query = request.getfixturevalue(case.query)
+    url = url_builder.build_url(query, **case.build_kwargs)
+    url_str = str(url)
+
+    # Same key order as the committed fixtures: the time window follows the filter
+    notes = dict(case.metadata)
+    metadata = {"description": case.description}
+    if "filter" in notes:
+        metadata["filter"] = notes.pop("filter")
+    metadata.update(_window_note(query))
+    metadata.update(notes)
+
+    save_url_result(
+        write_queue,
+        url_output_dir,
+        case.name,
+        query,
+        url,
+        metadata,
+        subfolder=case.subfolder,
+        url_str=url_str
+    )
 
-        assert "compare_tr=rill-PP" in str(url_with_compare)
-        assert "compare_tr" not in str(url_no_compare)
-        print(f"\n✓ Generated URLs with and without comparison")
-
-    def test_url_with_timezone_variations(self, url_builder, url_output_dir):
-        """Generate URLs with different timezones"""
-        timezones = [
-            ("America/New_York", "Eastern Time"),
-            ("Europe/London", "British Time"),
-            ("Asia/Tokyo", "Japan Time"),
-            ("UTC", "Coordinated Universal Time")
-        ]
-
-        for tz, description in timezones:
-            query = MetricsQuery(
-                metrics_view=TEST_METRICS_VIEW,
-                dimensions=[Dimension(name="advertiser_name")],
-                measures=[Measure(name="overall_spend")],
-                time_range=TimeRange(iso_duration="P7D"),
-                time_zone=tz,
-                sort=[Sort(name="overall_spend", desc=True)]
-            )
+    for expected in case.expected:
+        assert expected in url_str
+    for unexpected in case.unexpected:
+        assert unexpected not in url_str
 
-            url = url_builder.build_url(query)
-
-            save_url_result(
-                url_output_dir,
-                f"url_timezone_{tz.replace('/', '_')}",
-                query,
-                url,
-                {
-                    "description": f"URL with {description} timezone",
-                    "timezone": tz,
-                    "expected_encoding": f"tz={tz.replace('/', '%2F')}"
-                },
-                subfolder="variations"
-            )
 
-        print(f"\n✓ Generated URLs for {len(timezones)} different timezones")
+class TestMetricsQueryUrlGeneration:
+    """Generate URLs for all MetricsQuery tests from test_query_e2e.py"""
+
+    @pytest.mark.parametrize("case", QUERY_URL_CASES, ids=lambda case: case.name)
+    def test_url_generation(self, request, url_builder, url_output_dir, write_queue, case):
+        """Generate the URL for one query (see QUERY_URL_CASES)"""
+        _check_url_case(request, url_builder, url_output_dir, write_queue, case)
+
+
+class TestUrlBuilderVariations:
+    """Test UrlBuilder with different parameter variations"""
+
+    @pytest.mark.parametrize("case", VARIATION_URL_CASES, ids=lambda case: case.name)
+    def test_url_variation(self, request, url_builder, url_output_dir, write_queue, case):
+        """Generate one side of a build_url() option comparison (see VARIATION_URL_CASES)"""
+        _check_url_case(request, url_builder, url_output_dir, write_queue, case)
+
+    @pytest.mark.parametrize("tz,description", TIMEZONES, ids=[tz for tz, _ in TIMEZONES])
+    def test_url_with_timezone(self, request, url_builder, url_output_dir, write_queue, tz, description):
+        """Generate a URL with a non-default timezone"""
+        encoded = f"tz={quote(tz, safe='')}"
+        _check_url_case(request, url_builder, url_output_dir, write_queue, UrlCase(
+            f"url_timezone_{tz.replace('/', '_')}",
+            "q_timezone",
+            f"URL with {description} timezone",
+            subfolder="variations",
+            metadata={"timezone": tz, "expected_encoding": encoded},
+            expected=(encoded,),
+        ))
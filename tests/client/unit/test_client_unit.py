@@ -158,6 +158,73 @@ class TestRillClientAPIRequests:
         with pytest.raises(RillAPIError):
             rill_client_with_mocks._make_api_request("GET", "test/endpoint")
 
+    def test_make_api_request_reuses_http_client(self, rill_client_with_mocks, monkeypatch):
+        """Test that requests share one pooled httpx.Client"""
+        mock_instance = MagicMock()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {}
+        mock_instance.request.return_value = mock_response
+
+        import httpx
+        mock_client_class = Mock(return_value=mock_instance)
+        monkeypatch.setattr(httpx, "Client", mock_client_class)
+
+        rill_client_with_mocks._make_api_request("GET", "test/one")
+        rill_client_with_mocks._make_api_request("GET", "test/two")
+
+        assert mock_client_class.call_count == 1
+        assert mock_instance.request.call_count == 2
+
+    def test_http_client_shared_across_threads(self, rill_client_with_mocks, monkeypatch):
+        """Test that concurrent first requests from several threads create one pooled client"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        import httpx
+        mock_client_class = Mock(side_effect=lambda **kwargs: MagicMock())
+        monkeypatch.setattr(httpx, "Client", mock_client_class)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: rill_client_with_mocks._get_http_client(), range(8)))
+
+        assert mock_client_class.call_count == 1
+        assert all(c is clients[0] for c in clients)
+
+    def test_close_releases_http_client(self, rill_client_with_mocks, monkeypatch):
+        """Test that close() closes the pooled client and is idempotent"""
+        mock_instance = MagicMock()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {}
+        mock_instance.request.return_value = mock_response
+
+        import httpx
+        monkeypatch.setattr(httpx, "Client", Mock(return_value=mock_instance))
+
+        with rill_client_with_mocks as client:
+            client._make_api_request("GET", "test/endpoint")
+
+        mock_instance.close.assert_called_once()
+        rill_client_with_mocks.close()
+        mock_instance.close.assert_called_once()
+
+    def test_make_api_request_does_not_retry_errors(self, rill_client_with_mocks, monkeypatch):
+        """Test that a failed request is sent exactly once (no retries)"""
+        mock_instance = MagicMock()
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.reason_phrase = "Not Found"
+        mock_response.text = "Resource not found"
+        mock_instance.request.return_value = mock_response
+
+        import httpx
+        monkeypatch.setattr(httpx, "Client", Mock(return_value=mock_instance))
+
+        with pytest.raises(RillAPIError):
+            rill_client_with_mocks._make_api_request("GET", "test/endpoint")
+
+        assert mock_instance.request.call_count == 1
+
 
 @pytest.mark.unit
 class TestRillClientCache:
@@ -288,6 +288,31 @@ class TestIFrameResponseModel:
                 ttl_seconds="invalid"
             )
 
+    def test_iframe_response_query_params(self):
+        """Test that iframe_src is parsed once into parsed_url and query_params"""
+        response = IFrameResponse(
+            iframe_src="https://ui.rilldata.com/-/embed?access_token=token123&instance_id=inst_123&theme_mode=dark",
+            runtime_host="https://runtime.rilldata.com",
+            instance_id="inst_123",
+            access_token="token123",
+            ttl_seconds=86400
+        )
+
+        assert response.parsed_url.netloc == "ui.rilldata.com"
+        assert response.parsed_url.path == "/-/embed"
+        assert response.query_params == {
+            "access_token": ["token123"],
+            "instance_id": ["inst_123"],
+            "theme_mode": ["dark"],
+        }
+        # Cached: repeated access returns the same objects
+        assert response.query_params is response.query_params
+        assert response.parsed_url is response.parsed_url
+
+        # Cached properties are not part of the serialized model
+        assert "query_params" not in response.model_dump()
+        assert "parsed_url" not in response.model_dump()
+
 
 class TestIFrameModelsIntegration:
     """Integration tests between IFrameOptions and IFrameResponse"""
@@ -11,6 +11,9 @@ from pyrill import RillClient
 from pyrill.models.reports import (
     Report,
     ReportOptions,
+    ReportSpec,
+    ReportState,
+    Schedule,
     ExportFormat,
     CreateReportResponse,
     EditReportResponse,
@@ -516,3 +519,36 @@ class TestReportsModels:
         assert ExportFormat.CSV.value == "EXPORT_FORMAT_CSV"
         assert ExportFormat.XLSX.value == "EXPORT_FORMAT_XLSX"
         assert ExportFormat.PARQUET.value == "EXPORT_FORMAT_PARQUET"
+        assert ExportFormat.UNSPECIFIED.value == "EXPORT_FORMAT_UNSPECIFIED"
+
+    def test_report_model_accepts_minimal_data(self):
+        """Test Report model can be instantiated with minimal data"""
+        report = Report(name="test-report")
+
+        assert report.name == "test-report"
+        assert report.spec is None
+        assert report.state is None
+
+    def test_report_model_accepts_full_data(self):
+        """Test Report model can be instantiated with complete data"""
+        # Nested data is passed as plain dicts, as Reports.list() does with API
+        # payloads, so the whole tree is validated in a single pass
+        report = Report(
+            name="test-report",
+            spec={
+                "display_name": "Test Report",
+                "refresh_schedule": {"cron": "0 9 * * 1"},
+                "query_name": "test_query",
+            },
+            state={
+                "next_run_on": "2024-01-22T09:00:00Z",
+                "execution_count": 10,
+            },
+        )
+
+        assert report.name == "test-report"
+        assert isinstance(report.spec, ReportSpec)
+        assert isinstance(report.spec.refresh_schedule, Schedule)
+        assert isinstance(report.state, ReportState)
+        assert report.spec.display_name == "Test Report"
+        assert report.state.execution_count == 10
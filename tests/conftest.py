@@ -5,29 +5,33 @@ This file contains shared configuration that applies to all client tests.
 Client-specific fixtures are in tests/client/conftest.py.
 """
 
+import os
 import pytest
 import shutil
 from pathlib import Path
 
 
+DEBUG_DIR = Path(__file__).parent / "debug"
+
+
+def _reset_debug_folder():
+    """Remove the debug folder so each run starts from a clean slate"""
+    if DEBUG_DIR.exists():
+        shutil.rmtree(DEBUG_DIR)
+
+
 @pytest.fixture(scope="session", autouse=True)
 def clear_debug_folder():
     """
-    Session-scoped fixture that clears the debug folder ONCE before any tests run.
+    Session-scoped fixture that provides a clean debug folder before any tests run.
 
-    This ensures a clean slate for each test run across ALL test types (unit, e2e, browser).
-    Runs automatically before any tests in the entire session.
+    The folder itself is cleared ONCE per e2e run in pytest_sessionstart (on the
+    xdist controller when running with -n), so parallel workers never delete each
+    other's output. This fixture only recreates the shared folder structure.
     """
-    debug_dir = Path(__file__).parent / "debug"
-
-    # Clear debug folder if it exists
-    if debug_dir.exists():
-        shutil.rmtree(debug_dir)
-
-    # Recreate empty debug folder structure
-    debug_dir.mkdir(parents=True, exist_ok=True)
-    (debug_dir / "reports").mkdir(exist_ok=True)
-    (debug_dir / "screenshots").mkdir(exist_ok=True)
+    DEBUG_DIR.mkdir(parents=True, exist_ok=True)
+    (DEBUG_DIR / "reports").mkdir(exist_ok=True)
+    (DEBUG_DIR / "screenshots").mkdir(exist_ok=True)
 
     yield  # Tests run here
 
@@ -57,10 +61,27 @@ def mock_env_without_token(monkeypatch):
 # Pytest configuration hooks
 
 def pytest_configure(config):
-    """Configure custom markers"""
-    config.addinivalue_line("markers", "unit: Unit tests")
-    config.addinivalue_line("markers", "integration: Integration tests")
-    config.addinivalue_line("markers", "e2e: End-to-end tests requiring real credentials")
+    """Apply session-wide options (markers are registered in pyproject.toml)"""
+    # Opt in to writing e2e debug artifacts (read by the e2e modules at import)
+    if config.getoption("--e2e-debug", default=False):
+        os.environ["PYRILL_E2E_DEBUG"] = "1"
+
+    # Modules that prefetch a query batch are marked xdist_group so the batch
+    # runs on one worker; plain -n N (dist=load) would ignore the mark
+    if getattr(config.option, "dist", "no") == "load":
+        config.option.dist = "loadgroup"
+
+
+def pytest_sessionstart(session):
+    """Clear the debug folder once before an e2e run"""
+    config = session.config
+    # Only e2e runs write debug output; --collect-only and unit runs keep the last one
+    if not config.getoption("--run-e2e", default=False) or config.option.collectonly:
+        return
+    # xdist workers share the controller's debug folder; only clear it once
+    if hasattr(config, "workerinput"):
+        return
+    _reset_debug_folder()
 
 
 def pytest_collection_modifyitems(config, items):
@@ -80,6 +101,18 @@ def pytest_addoption(parser):
         default=False,
         help="Run end-to-end tests (requires real credentials)"
     )
+    parser.addoption(
+        "--e2e-debug",
+        action="store_true",
+        default=False,
+        help="Save e2e debug output under tests/debug (same as PYRILL_E2E_DEBUG=1)"
+    )
+    parser.addoption(
+        "--write-fixtures",
+        action="store_true",
+        default=False,
+        help="Rewrite the generated URL fixtures under tests/fixtures/query_results/object/urls"
+    )
     parser.addoption(
         "--capture-screenshots",
         action="store_true",
@@ -100,6 +133,10 @@ def pytest_sessionfinish(session, exitstatus):
     if not session.config.getoption("--run-e2e", default=False):
         return
 
+    # Under xdist, let the controller summarize once all workers have finished
+    if hasattr(session.config, "workerinput"):
+        return
+
     from pathlib import Path
     from tests.fixtures.report_generator import generate_summary_and_readme
 